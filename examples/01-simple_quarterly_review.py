@@ -11,13 +11,23 @@ This simplified example demonstrates core prompt engineering concepts:
 """
 
 import random
-from textwrap import dedent, indent
+import sys
+from collections.abc import Iterator
+from functools import lru_cache
+from textwrap import dedent
 
 from proompt.base.context import Context, ToolContext
 from proompt.base.prompt import BasePrompt, PromptSection
 from proompt.base.provider import BaseProvider
 
-INDENT_12 = " " * 12
+_SEP40 = "=" * 40
+_SECTION_SEP = f"\n\n{_SEP40}\n\n"
+
+
+@lru_cache(maxsize=1024)
+def _fmt_int(n: int) -> str:
+    """Thousands-grouped int formatting, cached per value for repeated renders."""
+    return f"{n:,}"
 
 # CUSTOM DATA PROVIDER
 
@@ -25,8 +35,12 @@ INDENT_12 = " " * 12
 class SimpleMetricsProvider(BaseProvider[dict]):
     """Fetches basic business metrics."""
 
-    def __init__(self, quarter: str):
+    __slots__ = ("quarter", "_rng")
+
+    def __init__(self, quarter: str, seed: int | None = None):
         self.quarter = quarter
+        # Per-instance RNG: no shared state across providers, reproducible when seeded
+        self._rng = random.Random(seed)
 
     @property
     def name(self) -> str:
@@ -40,21 +54,26 @@ class SimpleMetricsProvider(BaseProvider[dict]):
         """Return basic business metrics."""
         return {
             "quarter": self.quarter,
-            "revenue": random.randint(1000000, 2000000),
-            "users": random.randint(50000, 100000),
-            "growth": round(random.uniform(0.05, 0.15), 3),
+            "revenue": self._rng.randint(1000000, 2000000),
+            "users": self._rng.randint(50000, 100000),
+            "growth": round(self._rng.uniform(0.05, 0.15), 3),
         }
 
 
 # ANALYSIS TOOL
 
 
+def _growth_kernel(current: float, previous: float) -> float:
+    """Numeric core of the growth calculation, kept free of string work for batch callers."""
+    return (current - previous) / previous
+
+
 def calculate_growth_rate(current: float, previous: float) -> dict[str, str]:
     """Calculate simple growth rate."""
     if previous == 0:
         return {"growth_rate": "N/A", "trend": "new"}
 
-    rate = (current - previous) / previous
+    rate = _growth_kernel(current, previous)
     trend = "up" if rate > 0 else "down"
     return {"growth_rate": f"{rate:.1%}", "trend": trend}
 
@@ -65,6 +84,8 @@ def calculate_growth_rate(current: float, previous: float) -> dict[str, str]:
 class SimpleContext(Context):
     """Basic context for quarterly review."""
 
+    __slots__ = ("company", "quarter")
+
     def __init__(self, company: str, quarter: str):
         self.company = company
         self.quarter = quarter
@@ -85,79 +106,104 @@ class SimpleContext(Context):
 class MetricsSection(PromptSection):
     """Basic metrics analysis section."""
 
+    __slots__ = ("_tools_desc",)
+
+    # Dedented once at class definition so render only fills placeholders
+    _TEMPLATE = dedent("""\
+        ## QUARTERLY METRICS ANALYSIS
+
+        Analyze the quarterly business performance focusing on key metrics and trends.
+
+        ### Available Data:
+        {data}
+
+        ### Analysis Tools:
+        {tools_desc}
+
+        Provide insights and recommendations based on the metrics.""")
+
+    # Report scaffolding is constant, so dedent once and fill per metrics dict
+    _DATA_TPL = dedent("""\
+        ## Metrics Report - {quarter}
+        - **Revenue:** ${revenue}
+        - **Users:** {users}
+        - **Growth:** {growth:.1%}""")
+
     def _format_data(self, metrics: dict) -> str:
         """Format metrics into readable report."""
-        return dedent(f"""\
-            ## Metrics Report - {metrics["quarter"]}
-            - **Revenue:** ${metrics["revenue"]:,}
-            - **Users:** {metrics["users"]:,}
-            - **Growth:** {metrics["growth"]:.1%}""").strip()
+        return self._DATA_TPL.format_map(
+            {**metrics, "revenue": _fmt_int(metrics["revenue"]), "users": _fmt_int(metrics["users"])}
+        )
+
+    # Provider type -> formatter method, looked up by concrete type instead of
+    # per-provider isinstance checks
+    _HANDLERS = {SimpleMetricsProvider: "_format_data"}
+
+    def __init__(self, context: Context | None = None, tools: list | None = None, *providers: BaseProvider | None):
+        super().__init__(context, tools, *providers)
+        # Tools are fixed after construction, so join their names once here
+        self._tools_desc = ", ".join(tool.tool_name for tool in self.tools)
 
     def formatter(self) -> str:
-        # Get data from provider
+        # Get data from providers via constant-time type dispatch
         formatted_data = []
         for provider in self.providers:
-            if isinstance(provider, SimpleMetricsProvider):
-                metrics = provider.run()
-                formatted_data.append(self._format_data(metrics))
+            handler = self._HANDLERS.get(type(provider))
+            if handler:
+                formatted_data.append(getattr(self, handler)(provider.run()))
 
-        # Format with proper indentation
         data = "\n\n".join(formatted_data)
-        data = indent(data, INDENT_12)
+        return self._TEMPLATE.format(data=data, tools_desc=self._tools_desc)
 
-        tools_desc = ", ".join(tool.tool_name for tool in self.tools)
-        tools_desc = indent(tools_desc, INDENT_12)
+    def render(self) -> str:
+        return self.formatter()
 
-        return dedent(f"""\
-            ## QUARTERLY METRICS ANALYSIS
 
-            Analyze the quarterly business performance focusing on key metrics and trends.
+# CUSTOM PROMPT
 
-            ### Available Data:\n{data}
+# Header/footer scaffolding is static, so dedent it once at import time
+_HEADER_TMPL = dedent("""\
+    # QUARTERLY REVIEW: {company}
+    ## {quarter} Analysis
 
-            ### Analysis Tools:\n{tools_desc}
+    Simple quarterly business review focusing on core metrics.
 
-            Provide insights and recommendations based on the metrics.""").strip()
+    Analyze the data and provide actionable insights for business growth.""")
 
-    def render(self) -> str:
-        return self.formatter()
+_FOOTER = dedent(f"""\
 
+    {_SEP40}
 
-# CUSTOM PROMPT
+    ## SUMMARY
+
+    This demonstrates basic prompt engineering with:
+    - 1 Data Provider
+    - 1 Analysis Tool
+    - 1 Prompt Section
+    - Structured Output""").strip()
 
 
 class SimpleQuarterlyPrompt(BasePrompt):
     """Simple quarterly review prompt."""
 
+    __slots__ = ("company", "quarter")
+
     def __init__(self, company: str, quarter: str, *sections: PromptSection):
         super().__init__(*sections)
         self.company = company
         self.quarter = quarter
 
-    def render(self) -> str:
-        sections_content = "\n\n" + "=" * 40 + "\n\n".join(section.render() for section in self.sections)
-
-        header = dedent(f"""\
-            # QUARTERLY REVIEW: {self.company}
-            ## {self.quarter} Analysis
+    def render_iter(self) -> Iterator[str]:
+        """Yield the prompt in chunks, avoiding one giant in-memory string when streaming."""
+        yield _HEADER_TMPL.format(company=self.company, quarter=self.quarter)
+        for section in self.sections:
+            yield _SECTION_SEP
+            yield section.render()
+        yield "\n\n"
+        yield _FOOTER
 
-            Simple quarterly business review focusing on core metrics.
-
-            Analyze the data and provide actionable insights for business growth.""").strip()
-
-        footer = dedent(f"""\
-
-            {"=" * 40}
-
-            ## SUMMARY
-
-            This demonstrates basic prompt engineering with:
-            - 1 Data Provider
-            - 1 Analysis Tool  
-            - 1 Prompt Section
-            - Structured Output""").strip()
-
-        return header + sections_content + footer
+    def render(self) -> str:
+        return "".join(self.render_iter())
 
 
 # EXAMPLE EXECUTION
@@ -178,13 +224,17 @@ def main():
     metrics_section = MetricsSection(context, [growth_tool], metrics_provider)
     prompt = SimpleQuarterlyPrompt("StartupCorp", "Q3 2024", metrics_section)
 
-    # Display result
+    # Stream the prompt to stdout chunk by chunk, tallying stats as we go
     print("\nGenerated Prompt:")
-    print("=" * 40)
-    final_prompt = prompt.render()
-    print(final_prompt)
-
-    print(f"\n📊 Stats: {len(final_prompt):,} chars, {len(final_prompt.split()):,} words")
+    print(_SEP40)
+    char_count = word_count = 0
+    for chunk in prompt.render_iter():
+        sys.stdout.write(chunk)
+        char_count += len(chunk)
+        word_count += chunk.count(" ") + chunk.count("\n")
+    print()
+
+    print(f"\n📊 Stats: {_fmt_int(char_count)} chars, {_fmt_int(word_count + 1)} words")
 
 
 if __name__ == "__main__":
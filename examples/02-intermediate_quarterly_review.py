@@ -13,9 +13,13 @@ Simplified from the advanced example while maintaining core architectural concep
 """
 
 import random
-import statistics
+import sys
+import time
+from collections.abc import Iterator
 from datetime import datetime
-from textwrap import dedent, indent
+from functools import lru_cache
+from itertools import combinations
+from textwrap import dedent
 
 from proompt.base.context import Context, ToolContext
 from proompt.base.prompt import BasePrompt, PromptSection
@@ -23,15 +27,51 @@ from proompt.base.provider import BaseProvider
 
 INDENT_12 = " " * 12
 
+
+def _indent12(text: str) -> str:
+    """Prefix every line with 12 spaces, without textwrap.indent's per-line predicate calls."""
+    return INDENT_12 + text.replace("\n", "\n" + INDENT_12)
+
+
+_SEP60 = "=" * 60
+_SECTION_SEP = f"\n\n{_SEP60}\n\n"
+
+
+@lru_cache(maxsize=1024)
+def _fmt_int(n: int) -> str:
+    """Thousands-grouped int formatting, cached per value for repeated renders."""
+    return f"{n:,}"
+
+
+_NOW_CACHE = [0.0, ""]
+
+
+def _now_str() -> str:
+    """Minute-resolution timestamp, recomputed at most once per second for batch renders."""
+    now = time.time()
+    if now - _NOW_CACHE[0] > 1.0:
+        _NOW_CACHE[0] = now
+        _NOW_CACHE[1] = datetime.now().strftime("%Y-%m-%d %H:%M")
+    return _NOW_CACHE[1]
+
+
+_ERROR_TYPES = ("Authentication Error", "Database Timeout", "Rate Limit Exceeded", "Service Unavailable")
+# All C(4,2)=6 unordered error pairs, so run() picks an index instead of sampling
+_ERROR_PAIRS = tuple(combinations(_ERROR_TYPES, 2))
+
 # CUSTOM DATA PROVIDERS
 
 
 class MetricsAPIProvider(BaseProvider[dict]):
     """Simulates fetching business metrics from an API endpoint."""
 
-    def __init__(self, quarter: str, department: str = "all"):
+    __slots__ = ("quarter", "department", "_rng")
+
+    def __init__(self, quarter: str, department: str = "all", seed: int | None = None):
         self.quarter = quarter
         self.department = department
+        # Per-instance RNG: no shared state across providers, reproducible when seeded
+        self._rng = random.Random(seed)
 
     @property
     def name(self) -> str:
@@ -45,22 +85,26 @@ class MetricsAPIProvider(BaseProvider[dict]):
         """Simulate API call and return business metrics as structured data."""
         return {
             "quarter": self.quarter,
-            "revenue": random.randint(2500000, 3500000),
-            "user_growth_rate": round(random.uniform(0.08, 0.25), 3),
-            "active_users": random.randint(125000, 180000),
-            "churn_rate": round(random.uniform(0.02, 0.08), 3),
-            "net_promoter_score": random.randint(65, 85),
-            "server_uptime": round(random.uniform(0.995, 0.999), 4),
-            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "revenue": self._rng.randint(2500000, 3500000),
+            "user_growth_rate": round(self._rng.uniform(0.08, 0.25), 3),
+            "active_users": self._rng.randint(125000, 180000),
+            "churn_rate": round(self._rng.uniform(0.02, 0.08), 3),
+            "net_promoter_score": self._rng.randint(65, 85),
+            "server_uptime": round(self._rng.uniform(0.995, 0.999), 4),
+            "generated_at": _now_str(),
         }
 
 
 class LogAnalysisProvider(BaseProvider[str]):
     """Analyzes system logs to extract performance insights."""
 
-    def __init__(self, log_period: str, service_name: str = "web-api"):
+    __slots__ = ("log_period", "service_name", "_rng")
+
+    def __init__(self, log_period: str, service_name: str = "web-api", seed: int | None = None):
         self.log_period = log_period
         self.service_name = service_name
+        # Per-instance RNG: no shared state across providers, reproducible when seeded
+        self._rng = random.Random(seed)
 
     @property
     def name(self) -> str:
@@ -72,28 +116,27 @@ class LogAnalysisProvider(BaseProvider[str]):
 
     def run(self) -> str:
         """Analyze logs and return performance summary."""
-        error_types = ["Authentication Error", "Database Timeout", "Rate Limit Exceeded", "Service Unavailable"]
-
         analysis = {
             "period": self.log_period,
             "service": self.service_name,
-            "total_requests": random.randint(2500000, 4200000),
-            "error_rate": round(random.uniform(0.005, 0.025), 4),
-            "avg_response_time": random.randint(125, 350),
-            "peak_requests_per_second": random.randint(850, 1500),
-            "top_errors": [(error, random.randint(12, 156)) for error in random.sample(error_types, 2)],
+            "total_requests": self._rng.randint(2500000, 4200000),
+            "error_rate": round(self._rng.uniform(0.005, 0.025), 4),
+            "avg_response_time": self._rng.randint(125, 350),
+            "peak_requests_per_second": self._rng.randint(850, 1500),
+            "top_errors": [(error, self._rng.randint(12, 156)) for error in self._rng.choice(_ERROR_PAIRS)],
         }
 
         # Create detailed log analysis report with proper indentation for dedent
         error_details = "\n".join([f"- **{error}:** {count} occurrences" for error, count in analysis["top_errors"]])
-        error_details = indent(error_details, INDENT_12)
+        error_details = _indent12(error_details)
+        total_requests = _fmt_int(analysis["total_requests"])
 
         return dedent(f"""\
             ## System Performance Analysis - {self.log_period}
             **Service:** {self.service_name}
 
             ### Request Volume & Performance
-            - **Total Requests:** {analysis["total_requests"]:,}
+            - **Total Requests:** {total_requests}
             - **Average Response Time:** {analysis["avg_response_time"]}ms
             - **Peak Load:** {analysis["peak_requests_per_second"]} req/sec
             - **Error Rate:** {analysis["error_rate"]:.2%}
@@ -101,7 +144,7 @@ class LogAnalysisProvider(BaseProvider[str]):
             ### Error Analysis:\n{error_details}
 
             ### Performance Summary
-            System handled {analysis["total_requests"]:,} requests with {analysis["error_rate"]:.2%} error rate.
+            System handled {total_requests} requests with {analysis["error_rate"]:.2%} error rate.
             Response times averaged {analysis["avg_response_time"]}ms within acceptable SLA bounds.
             """).strip()
 
@@ -109,10 +152,15 @@ class LogAnalysisProvider(BaseProvider[str]):
 # ANALYSIS TOOLS
 
 
+def _trend_kernel(current_value: float, previous_value: float, periods: int) -> tuple[float, float]:
+    """Numeric core of the trend calculation, kept free of string work for batch callers."""
+    growth_rate = (current_value - previous_value) / previous_value if previous_value != 0 else 0
+    return growth_rate, current_value * (1 + growth_rate) ** periods
+
+
 def calculate_trend_analysis(current_value: float, previous_value: float, periods: int = 4) -> dict[str, float | str]:
     """Calculate trend metrics including growth rate and projections."""
-    growth_rate = (current_value - previous_value) / previous_value if previous_value != 0 else 0
-    projected_value = current_value * (1 + growth_rate) ** periods
+    growth_rate, projected_value = _trend_kernel(current_value, previous_value, periods)
 
     return {
         "growth_rate": growth_rate,
@@ -121,17 +169,29 @@ def calculate_trend_analysis(current_value: float, previous_value: float, period
     }
 
 
+def calculate_trend_analysis_batch(
+    current_values: list[float], previous_values: list[float], periods: int = 4
+) -> list[dict[str, float | str]]:
+    """Calculate trend metrics for paired value sequences in a single call."""
+    return [
+        calculate_trend_analysis(current, previous, periods)
+        for current, previous in zip(current_values, previous_values, strict=True)
+    ]
+
+
 def generate_statistical_summary(data_points: list[float]) -> dict[str, float | str]:
-    """Generate statistical summary of data points."""
+    """Generate statistical summary of data points with a single sort and pass."""
     if not data_points:
         return {"error": "No data points provided"}
 
-    return {
-        "mean": statistics.mean(data_points),
-        "median": statistics.median(data_points),
-        "std_dev": statistics.stdev(data_points) if len(data_points) > 1 else 0,
-        "count": len(data_points),
-    }
+    n = len(data_points)
+    ordered = sorted(data_points)
+    mean = sum(ordered) / n
+    mid = n // 2
+    median = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+    std_dev = (sum((x - mean) ** 2 for x in ordered) / (n - 1)) ** 0.5 if n > 1 else 0
+
+    return {"mean": mean, "median": median, "std_dev": std_dev, "count": n}
 
 
 # BUSINESS CONTEXT
@@ -140,6 +200,8 @@ def generate_statistical_summary(data_points: list[float]) -> dict[str, float |
 class BusinessContext(Context):
     """Context for quarterly business review with company and period information."""
 
+    __slots__ = ("company_name", "quarter", "year", "review_date")
+
     def __init__(self, company_name: str, quarter: str, year: int):
         self.company_name = company_name
         self.quarter = quarter
@@ -161,54 +223,90 @@ class BusinessContext(Context):
 # CUSTOM PROMPT SECTIONS
 
 
+@lru_cache(maxsize=32)
+def _bullet_block(items: tuple[str, ...], title_case: bool = False) -> str:
+    """Render a bullet list, cached by item tuple so default-argument renders reuse it."""
+    return "\n".join(f"• {item.title() if title_case else item}" for item in items)
+
+
+def _collect_provider_data(section: PromptSection) -> list[str]:
+    """Format provider output using the section's type->handler dispatch table."""
+    handlers = section._HANDLERS
+    formatted_data = []
+    for provider in section.providers:
+        handler = handlers.get(type(provider))
+        if handler is None:
+            # Provider subclass not seen before: resolve once via isinstance and cache
+            for provider_type, name in list(handlers.items()):
+                if isinstance(provider, provider_type):
+                    handler = handlers[type(provider)] = name
+                    break
+            else:
+                continue
+        formatted_data.append(getattr(section, handler)(provider.cached_run()))
+    return formatted_data
+
+
 class ExecutiveSummarySection(PromptSection):
     """Creates executive-level summary focused on key business outcomes."""
 
-    def _format_metrics_data(self, metrics: dict) -> str:
-        """Format metrics dictionary into a readable report."""
-        return dedent(f"""\
-            ## Business Metrics Report - {metrics["quarter"]}
-            **Generated:** {metrics["generated_at"]}
+    __slots__ = ("_tools_desc",)
 
-            ### Key Metrics
-            - **Revenue:** ${metrics["revenue"]:,}
-            - **User Growth Rate:** {metrics["user_growth_rate"]:.1%}
-            - **Active Users:** {metrics["active_users"]:,}
-            - **Churn Rate:** {metrics["churn_rate"]:.1%}
-            - **Net Promoter Score:** {metrics["net_promoter_score"]}
-            - **Server Uptime:** {metrics["server_uptime"]:.1%}""").strip()
+    # Dedented once at class definition so render only fills placeholders
+    _TEMPLATE = dedent("""\
+        ## EXECUTIVE SUMMARY ANALYSIS
 
-    def formatter(self, focus_areas: list[str] | None = None) -> str:
-        focus_areas = focus_areas or ["revenue", "growth", "performance"]
+        You are conducting a quarterly executive briefing for senior leadership. Focus on high-level
+        business impact, actionable insights, and recommendations for next quarter.
 
-        # Collect data from providers - only handle MetricsAPIProvider
-        formatted_data = []
-        for provider in self.providers:
-            if isinstance(provider, MetricsAPIProvider):
-                metrics = provider.run()
-                formatted_data.append(self._format_metrics_data(metrics))
+        ### Key Focus Areas:
+        {focus_list}
 
-        # Ensure consistent indentation for dedent to work properly
-        data = "\n\n".join(formatted_data)
-        data = indent(data, INDENT_12)
-        tools_desc = ", ".join(tool.tool_name for tool in self.tools)
-        tools_desc = indent(tools_desc, INDENT_12)
-        focus_list = "\n".join(f"• {area}" for area in focus_areas)
-        focus_list = indent(focus_list, INDENT_12)
+        ### Available Data Sources:
+        {data}
 
-        return dedent(f"""\
-            ## EXECUTIVE SUMMARY ANALYSIS
+        ### Analysis Tools Available:
+        {tools_desc}
+
+        Provide an executive summary with critical findings and strategic actions.""")
 
-            You are conducting a quarterly executive briefing for senior leadership. Focus on high-level 
-            business impact, actionable insights, and recommendations for next quarter.
+    # Provider type -> formatter method, looked up by concrete type instead of
+    # per-provider isinstance checks
+    _HANDLERS = {MetricsAPIProvider: "_format_metrics_data"}
 
-            ### Key Focus Areas:\n{focus_list}
+    def __init__(self, context: Context | None = None, tools: list | None = None, *providers: BaseProvider | None):
+        super().__init__(context, tools, *providers)
+        # Tools are fixed after construction, so join their names once here
+        self._tools_desc = ", ".join(tool.tool_name for tool in self.tools)
 
-            ### Available Data Sources:\n{data}
+    # Report scaffolding is constant, so dedent once and fill per metrics dict
+    _METRICS_TPL = dedent("""\
+        ## Business Metrics Report - {quarter}
+        **Generated:** {generated_at}
 
-            ### Analysis Tools Available:\n{tools_desc}
+        ### Key Metrics
+        - **Revenue:** ${revenue}
+        - **User Growth Rate:** {user_growth_rate:.1%}
+        - **Active Users:** {active_users}
+        - **Churn Rate:** {churn_rate:.1%}
+        - **Net Promoter Score:** {net_promoter_score}
+        - **Server Uptime:** {server_uptime:.1%}""")
 
-            Provide an executive summary with critical findings and strategic actions.""").strip()
+    def _format_metrics_data(self, metrics: dict) -> str:
+        """Format metrics dictionary into a readable report."""
+        return self._METRICS_TPL.format_map(
+            {**metrics, "revenue": _fmt_int(metrics["revenue"]), "active_users": _fmt_int(metrics["active_users"])}
+        )
+
+    def formatter(self, focus_areas: list[str] | None = None) -> str:
+        focus_areas = focus_areas or ["revenue", "growth", "performance"]
+
+        formatted_data = _collect_provider_data(self)
+
+        data = "\n\n".join(formatted_data)
+        focus_list = _bullet_block(tuple(focus_areas))
+
+        return self._TEMPLATE.format(focus_list=focus_list, data=data, tools_desc=self._tools_desc)
 
     def render(self) -> str:
         return self.formatter()
@@ -217,46 +315,58 @@ class ExecutiveSummarySection(PromptSection):
 class TechnicalAnalysisSection(PromptSection):
     """Detailed technical performance analysis for engineering and operations teams."""
 
-    def _format_metrics_data(self, metrics: dict) -> str:
-        """Format metrics dictionary into a readable report."""
-        return dedent(f"""\
-            ## Business Metrics - {metrics["quarter"]}
-            ### Key Metrics
-            - **Revenue:** ${metrics["revenue"]:,}
-            - **Active Users:** {metrics["active_users"]:,}
-            - **Server Uptime:** {metrics["server_uptime"]:.1%}""").strip()
+    __slots__ = ("_tools_info",)
 
-    def formatter(self, metrics_focus: list[str] | None = None) -> str:
-        metrics_focus = metrics_focus or ["performance", "reliability", "scalability"]
+    _TEMPLATE = dedent("""\
+        ## TECHNICAL PERFORMANCE DEEP DIVE
 
-        # Collect data from providers - handle specific provider types
-        formatted_data = []
-        for provider in self.providers:
-            if isinstance(provider, MetricsAPIProvider):
-                metrics = provider.run()
-                formatted_data.append(self._format_metrics_data(metrics))
-            elif isinstance(provider, LogAnalysisProvider):
-                log_report = provider.run()
-                formatted_data.append(log_report)
-
-        # Ensure consistent indentation for dedent to work properly
-        data = "\n\n".join(indent(fd, INDENT_12) for fd in formatted_data)
-        tools_info = "\n".join(indent(f"- {tool.tool_name}: {tool.tool_description}", INDENT_12) for tool in self.tools)
-        metrics_scope = "\n".join(indent(f"• {metric.title()}", INDENT_12) for metric in metrics_focus)
+        Conduct a comprehensive technical analysis focusing on system performance and operational excellence.
 
-        return dedent(f"""\
-            ## TECHNICAL PERFORMANCE DEEP DIVE
+        ### Technical Analysis Scope:
+        {metrics_scope}
+
+        ### System Data Available:
+        {data}
 
-            Conduct a comprehensive technical analysis focusing on system performance and operational excellence.
+        ### Analysis Capabilities:
+        {tools_info}
 
-            ### Technical Analysis Scope:\n{metrics_scope}
+        Provide technical assessment covering performance metrics, reliability, and operational efficiency.
+        Use quantitative analysis and provide specific recommendations.""")
 
-            ### System Data Available:\n{data}
+    _HANDLERS = {MetricsAPIProvider: "_format_metrics_data", LogAnalysisProvider: "_format_log_report"}
 
-            ### Analysis Capabilities:\n{tools_info}
+    def __init__(self, context: Context | None = None, tools: list | None = None, *providers: BaseProvider | None):
+        super().__init__(context, tools, *providers)
+        # Tools are fixed after construction, so build the description block once here
+        self._tools_info = "\n".join(f"- {tool.tool_name}: {tool.tool_description}" for tool in self.tools)
 
-            Provide technical assessment covering performance metrics, reliability, and operational efficiency.
-            Use quantitative analysis and provide specific recommendations.""").strip()
+    def _format_log_report(self, report: str) -> str:
+        """Log reports arrive pre-formatted from the provider."""
+        return report
+
+    _METRICS_TPL = dedent("""\
+        ## Business Metrics - {quarter}
+        ### Key Metrics
+        - **Revenue:** ${revenue}
+        - **Active Users:** {active_users}
+        - **Server Uptime:** {server_uptime:.1%}""")
+
+    def _format_metrics_data(self, metrics: dict) -> str:
+        """Format metrics dictionary into a readable report."""
+        return self._METRICS_TPL.format_map(
+            {**metrics, "revenue": _fmt_int(metrics["revenue"]), "active_users": _fmt_int(metrics["active_users"])}
+        )
+
+    def formatter(self, metrics_focus: list[str] | None = None) -> str:
+        metrics_focus = metrics_focus or ["performance", "reliability", "scalability"]
+
+        formatted_data = _collect_provider_data(self)
+
+        data = "\n\n".join(formatted_data)
+        metrics_scope = _bullet_block(tuple(metrics_focus), title_case=True)
+
+        return self._TEMPLATE.format(metrics_scope=metrics_scope, data=data, tools_info=self._tools_info)
 
     def render(self) -> str:
         return self.formatter()
@@ -264,50 +374,75 @@ class TechnicalAnalysisSection(PromptSection):
 
 # FULL CUSTOM PROMPT
 
+# Header/footer scaffolding is static, so dedent it once at import time
+_HEADER_TMPL = dedent("""\
+    # QUARTERLY BUSINESS REVIEW: {company_name}
+    ## {quarter} {year} Analysis
 
-class QuarterlyReviewPrompt(BasePrompt):
-    """Comprehensive quarterly business review prompt combining all analysis sections."""
+    **Generated:** {generated_at}
+    **Analysis Type:** Multi-dimensional Business Intelligence Review
 
-    def __init__(self, company_name: str, quarter: str, year: int, *sections: PromptSection):
-        super().__init__(*sections)
-        self.company_name = company_name
-        self.quarter = quarter
-        self.year = year
-        self.generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    This quarterly review integrates business metrics and technical performance data to provide
+    actionable insights for strategic decision-making.
 
-    def render(self) -> str:
-        sections_content = "\n\n" + "=" * 60 + "\n\n".join(section.render() for section in self.sections)
+    Please analyze all provided data sources thoroughly and deliver insights that are data-driven,
+    actionable, and aligned with business objectives.""")
 
-        header = dedent(f"""\
-            # QUARTERLY BUSINESS REVIEW: {self.company_name}
-            ## {self.quarter} {self.year} Analysis
+_FOOTER_TMPL = dedent(f"""\
 
-            **Generated:** {self.generated_at}
-            **Analysis Type:** Multi-dimensional Business Intelligence Review
+    {_SEP60}
 
-            This quarterly review integrates business metrics and technical performance data to provide 
-            actionable insights for strategic decision-making.
+    ## ANALYSIS FRAMEWORK SUMMARY
 
-            Please analyze all provided data sources thoroughly and deliver insights that are data-driven, 
-            actionable, and aligned with business objectives.""").strip()
+    This prompt demonstrates object-oriented prompt engineering by:
+    - **Integrating Multiple Data Sources**: Business APIs and system logs
+    - **Applying Specialized Analysis Tools**: Statistical analysis and trend calculation
+    - **Structuring Analysis**: Executive and technical perspectives
+    - **Ensuring Consistency**: Standardized data formats and analysis approaches
 
-        footer = dedent(f"""\
+    **Total Data Providers:** {{n_providers}}
+    **Analysis Tools:** {{n_tools}}
+    **Report Sections:** {{n_sections}}""").strip()
 
-            {"=" * 60}
 
-            ## ANALYSIS FRAMEWORK SUMMARY
+class QuarterlyReviewPrompt(BasePrompt):
+    """Comprehensive quarterly business review prompt combining all analysis sections."""
+
+    __slots__ = ("company_name", "quarter", "year", "generated_at")
 
-            This prompt demonstrates object-oriented prompt engineering by:
-            - **Integrating Multiple Data Sources**: Business APIs and system logs
-            - **Applying Specialized Analysis Tools**: Statistical analysis and trend calculation
-            - **Structuring Analysis**: Executive and technical perspectives
-            - **Ensuring Consistency**: Standardized data formats and analysis approaches
+    def __init__(self, company_name: str, quarter: str, year: int, *sections: PromptSection):
+        super().__init__(*sections)
+        self.company_name = company_name
+        self.quarter = quarter
+        self.year = year
+        self.generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            **Total Data Providers:** {len([p for section in self.sections for p in section.providers if p is not None])}
-            **Analysis Tools:** {len([t for section in self.sections for t in section.tools])}
-            **Report Sections:** {len(self.sections)}""").strip()
+    def render_iter(self) -> Iterator[str]:
+        """Yield the prompt in chunks, avoiding one giant in-memory string when streaming."""
+        # Deduplicate by identity and pre-run, so a provider registered with
+        # several sections executes exactly once per render
+        unique_providers = {id(p): p for section in self.sections for p in section.providers if p is not None}
+        for provider in unique_providers.values():
+            provider.invalidate()
+            provider.cached_run()
+
+        yield _HEADER_TMPL.format(
+            company_name=self.company_name, quarter=self.quarter, year=self.year, generated_at=self.generated_at
+        )
+
+        # Count providers and tools in one pass instead of two throwaway lists
+        n_providers = n_tools = 0
+        for section in self.sections:
+            n_providers += sum(1 for p in section.providers if p is not None)
+            n_tools += len(section.tools)
+            yield _SECTION_SEP
+            yield section.render()
+
+        yield "\n\n"
+        yield _FOOTER_TMPL.format(n_providers=n_providers, n_tools=n_tools, n_sections=len(self.sections))
 
-        return header + sections_content + footer
+    def render(self) -> str:
+        return "".join(self.render_iter())
 
 
 # EXAMPLE EXECUTION
@@ -344,16 +479,21 @@ def main():
     quarterly_prompt = QuarterlyReviewPrompt("TechCorp Solutions", "Q3", 2024, executive_section, technical_section)
 
     # Render and display the final prompt
-    print("\n" + "=" * 60)
+    print("\n" + _SEP60)
     print("GENERATED QUARTERLY REVIEW PROMPT")
-    print("=" * 60)
+    print(_SEP60)
 
-    final_prompt = quarterly_prompt.render()
-    print(final_prompt)
+    # Stream the prompt to stdout chunk by chunk, tallying stats as we go
+    char_count = word_count = 0
+    for chunk in quarterly_prompt.render_iter():
+        sys.stdout.write(chunk)
+        char_count += len(chunk)
+        word_count += chunk.count(" ") + chunk.count("\n")
+    print()
 
     print("\n\n📈 Prompt Statistics:")
-    print(f"   • Total Characters: {len(final_prompt):,}")
-    print(f"   • Total Words: {len(final_prompt.split()):,}")
+    print(f"   • Total Characters: {_fmt_int(char_count)}")
+    print(f"   • Total Words: {_fmt_int(word_count + 1)}")
     print("   • Data Sources: 2 custom providers (dict, str)")
     print("   • Analysis Tools: 2 statistical functions")
     print("   • Prompt Sections: 2 specialized sections")
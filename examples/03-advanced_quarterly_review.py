@@ -15,15 +15,54 @@ The example showcases:
 """
 
 import random
-import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from textwrap import dedent, indent
+from functools import lru_cache
+from itertools import combinations
+from textwrap import dedent
 
 from proompt.base.context import Context, ToolContext
 from proompt.base.prompt import BasePrompt, PromptSection
 from proompt.base.provider import BaseProvider
 
 INDENT_12 = " " * 12
+# Invariant join separator: newline plus indent prefix, built once at import
+_NL_INDENT = "\n" + INDENT_12
+# Section separator built once at import: blank line, 80-char rule, blank line
+# Banner rule shared by the section separator, footer, and main() output
+_BAR80 = "=" * 80
+
+_SECTION_SEP = f"\n\n{_BAR80}\n\n"
+
+_NOW_CACHE: dict[str, tuple[float, str]] = {}
+
+
+def _now_str(fmt: str = "%Y-%m-%d %H:%M") -> str:
+    """Formatted current time, recomputed at most once per second for batch renders."""
+    now = time.time()
+    cached = _NOW_CACHE.get(fmt)
+    if cached is None or now - cached[0] > 1.0:
+        _NOW_CACHE[fmt] = cached = (now, datetime.now().strftime(fmt))
+    return cached[1]
+
+
+# All three-error combinations, precomputed so each log analysis picks one
+# tuple instead of running a sampling loop
+_ERROR_TYPES = (
+    "Authentication Error",
+    "Database Timeout",
+    "Rate Limit Exceeded",
+    "Service Unavailable",
+    "Invalid Request",
+)
+_ERROR_TRIPLES = tuple(combinations(_ERROR_TYPES, 3))
+
+
+@lru_cache(maxsize=1024)
+def _fmt_int(n: int) -> str:
+    """Thousands-grouped int formatting, cached per value for repeated renders."""
+    return f"{n:,}"
 
 
 # CUSTOM DATA PROVIDERS
@@ -32,9 +71,11 @@ INDENT_12 = " " * 12
 class MetricsAPIProvider(BaseProvider[dict]):
     """Simulates fetching business metrics from an API endpoint."""
 
-    def __init__(self, quarter: str, department: str = "all"):
+    def __init__(self, quarter: str, department: str = "all", seed: int | None = None):
         self.quarter = quarter
         self.department = department
+        # Per-instance RNG: one state update stream per provider, reproducible when seeded
+        self._rng = random.Random(seed)
 
     @property
     def name(self) -> str:
@@ -50,26 +91,28 @@ class MetricsAPIProvider(BaseProvider[dict]):
         return {
             "quarter": self.quarter,
             "department": self.department,
-            "revenue": random.randint(2500000, 3500000),
-            "user_growth_rate": round(random.uniform(0.08, 0.25), 3),
-            "customer_acquisition_cost": random.randint(45, 85),
-            "monthly_recurring_revenue": random.randint(800000, 1200000),
-            "churn_rate": round(random.uniform(0.02, 0.08), 3),
-            "net_promoter_score": random.randint(65, 85),
-            "active_users": random.randint(125000, 180000),
-            "conversion_rate": round(random.uniform(0.12, 0.28), 3),
-            "server_uptime": round(random.uniform(0.995, 0.999), 4),
-            "support_ticket_resolution_time": round(random.uniform(2.1, 4.8), 1),
-            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "revenue": self._rng.randint(2500000, 3500000),
+            "user_growth_rate": round(self._rng.uniform(0.08, 0.25), 3),
+            "customer_acquisition_cost": self._rng.randint(45, 85),
+            "monthly_recurring_revenue": self._rng.randint(800000, 1200000),
+            "churn_rate": round(self._rng.uniform(0.02, 0.08), 3),
+            "net_promoter_score": self._rng.randint(65, 85),
+            "active_users": self._rng.randint(125000, 180000),
+            "conversion_rate": round(self._rng.uniform(0.12, 0.28), 3),
+            "server_uptime": round(self._rng.uniform(0.995, 0.999), 4),
+            "support_ticket_resolution_time": round(self._rng.uniform(2.1, 4.8), 1),
+            "generated_at": _now_str(),
         }
 
 
 class LogAnalysisProvider(BaseProvider[str]):
     """Analyzes system logs to extract performance insights."""
 
-    def __init__(self, log_period: str, service_name: str = "web-api"):
+    def __init__(self, log_period: str, service_name: str = "web-api", seed: int | None = None):
         self.log_period = log_period
         self.service_name = service_name
+        # Per-instance RNG: one state update stream per provider, reproducible when seeded
+        self._rng = random.Random(seed)
 
     @property
     def name(self) -> str:
@@ -82,27 +125,23 @@ class LogAnalysisProvider(BaseProvider[str]):
     def run(self) -> str:
         """Analyze logs and return performance summary."""
         # Simulate log analysis results
-        error_types = [
-            "Authentication Error",
-            "Database Timeout",
-            "Rate Limit Exceeded",
-            "Service Unavailable",
-            "Invalid Request",
-        ]
-
         analysis = {
             "period": self.log_period,
             "service": self.service_name,
-            "total_requests": random.randint(2500000, 4200000),
-            "error_rate": round(random.uniform(0.005, 0.025), 4),
-            "avg_response_time": random.randint(125, 350),
-            "peak_requests_per_second": random.randint(850, 1500),
-            "top_errors": [(error, random.randint(12, 156)) for error in random.sample(error_types, 3)],
+            "total_requests": self._rng.randint(2500000, 4200000),
+            "error_rate": round(self._rng.uniform(0.005, 0.025), 4),
+            "avg_response_time": self._rng.randint(125, 350),
+            "peak_requests_per_second": self._rng.randint(850, 1500),
+            "top_errors": [(error, self._rng.randint(12, 156)) for error in self._rng.choice(_ERROR_TRIPLES)],
         }
 
-        # Create detailed log analysis report with proper indentation
-        error_details = "\n".join([f"- **{error}:** {count} occurrences" for error, count in analysis["top_errors"]])
-        error_details = indent(error_details, INDENT_12)
+        # Build the indented error block in one pass: joining with a newline plus
+        # the indent prefix replaces the join-then-textwrap.indent re-scan
+        error_details = INDENT_12 + _NL_INDENT.join(
+            f"- **{error}:** {count} occurrences" for error, count in analysis["top_errors"]
+        )
+
+        total_requests = _fmt_int(analysis["total_requests"])
 
         report = dedent(f"""\
             ## System Performance Analysis - {self.log_period}
@@ -110,7 +149,7 @@ class LogAnalysisProvider(BaseProvider[str]):
             **Analysis Period:** {self.log_period}
 
             ### Request Volume & Performance
-            - **Total Requests Processed:** {analysis["total_requests"]:,}
+            - **Total Requests Processed:** {total_requests}
             - **Average Response Time:** {analysis["avg_response_time"]}ms
             - **Peak Load:** {analysis["peak_requests_per_second"]} req/sec
             - **Overall Error Rate:** {analysis["error_rate"]:.2%}
@@ -118,7 +157,7 @@ class LogAnalysisProvider(BaseProvider[str]):
             ### Error Analysis:\n{error_details}
 
             ### Performance Insights
-            - System handled {analysis["total_requests"]:,} requests with {analysis["error_rate"]:.2%} error rate
+            - System handled {total_requests} requests with {analysis["error_rate"]:.2%} error rate
             - Response times averaged {analysis["avg_response_time"]}ms, within acceptable SLA bounds
             - Peak load of {analysis["peak_requests_per_second"]} req/sec indicates strong capacity utilization
             """).strip()
@@ -129,9 +168,11 @@ class LogAnalysisProvider(BaseProvider[str]):
 class MarketDataProvider(BaseProvider[list[dict]]):
     """Provides competitive market analysis and industry benchmarks."""
 
-    def __init__(self, industry: str, region: str = "North America"):
+    def __init__(self, industry: str, region: str = "North America", seed: int | None = None):
         self.industry = industry
         self.region = region
+        # Per-instance RNG: one state update stream per provider, reproducible when seeded
+        self._rng = random.Random(seed)
 
     @property
     def name(self) -> str:
@@ -146,70 +187,77 @@ class MarketDataProvider(BaseProvider[list[dict]]):
         # Simulate market research data
         competitors = ["CompetitorA", "CompetitorB", "CompetitorC", "CompetitorD"]
 
-        # Return structured market data as a list of dictionaries
-        market_analysis = []
-
         # Add our company data
         our_data = {
             "company": "Our Company",
-            "market_share": round(random.uniform(0.03, 0.12), 3),
-            "revenue_estimate": random.randint(180, 350),  # millions
-            "employee_count": random.randint(800, 1500),
+            "market_share": round(self._rng.uniform(0.03, 0.12), 3),
+            "revenue_estimate": self._rng.randint(180, 350),  # millions
+            "employee_count": self._rng.randint(800, 1500),
             "founded_year": 2018,
             "primary_focus": "AI-Powered Analytics",
-            "growth_rate": round(random.uniform(0.15, 0.35), 3),
+            "growth_rate": round(self._rng.uniform(0.15, 0.35), 3),
             "funding_round": "Series C",
             "is_public": False,
             "industry": self.industry,
             "region": self.region,
         }
-        market_analysis.append(our_data)
-
-        # Add competitor data
-        for i, comp in enumerate(competitors[:4]):
-            competitor_data = {
-                "company": comp,
-                "market_share": round(random.uniform(0.02, 0.15), 3),
-                "revenue_estimate": random.randint(200, 800),  # millions
-                "employee_count": random.randint(500, 3000),
-                "founded_year": random.randint(2010, 2020),
-                "primary_focus": random.choice(
-                    [
-                        "Enterprise Software",
-                        "Cloud Infrastructure",
-                        "Data Analytics",
-                        "SaaS Platforms",
-                        "AI/ML Solutions",
-                    ]
-                ),
-                "growth_rate": round(random.uniform(0.08, 0.25), 3),
-                "funding_round": random.choice(["Series A", "Series B", "Series C", "IPO", "Private"]),
-                "is_public": random.choice([True, False]),
-                "industry": self.industry,
-                "region": self.region,
-            }
-            market_analysis.append(competitor_data)
-
-        # Add market overview metadata as the last entry
+
+        # Market overview metadata goes in the last entry
         market_overview = {
             "company": "_MARKET_OVERVIEW_",
-            "total_market_size": random.randint(15, 45),  # billions
-            "industry_growth_rate": round(random.uniform(0.06, 0.18), 3),
-            "industry_avg_churn": round(random.uniform(0.04, 0.09), 3),
-            "industry_avg_nps": random.randint(58, 74),
+            "total_market_size": self._rng.randint(15, 45),  # billions
+            "industry_growth_rate": round(self._rng.uniform(0.06, 0.18), 3),
+            "industry_avg_churn": round(self._rng.uniform(0.04, 0.09), 3),
+            "industry_avg_nps": self._rng.randint(58, 74),
             "major_trends": ["AI/ML Integration", "Cloud Migration", "Data Privacy Focus", "Remote Work Solutions"],
             "industry": self.industry,
             "region": self.region,
-            "analysis_date": datetime.now().strftime("%Y-%m-%d"),
+            "analysis_date": _now_str("%Y-%m-%d"),
         }
-        market_analysis.append(market_overview)
 
-        return market_analysis
+        # Final size is known up front, so build the whole list in one display
+        # instead of growing it append by append
+        return [
+            our_data,
+            *(
+                {
+                    "company": comp,
+                    "market_share": round(self._rng.uniform(0.02, 0.15), 3),
+                    "revenue_estimate": self._rng.randint(200, 800),  # millions
+                    "employee_count": self._rng.randint(500, 3000),
+                    "founded_year": self._rng.randint(2010, 2020),
+                    "primary_focus": self._rng.choice(
+                        [
+                            "Enterprise Software",
+                            "Cloud Infrastructure",
+                            "Data Analytics",
+                            "SaaS Platforms",
+                            "AI/ML Solutions",
+                        ]
+                    ),
+                    "growth_rate": round(self._rng.uniform(0.08, 0.25), 3),
+                    "funding_round": self._rng.choice(["Series A", "Series B", "Series C", "IPO", "Private"]),
+                    "is_public": self._rng.choice([True, False]),
+                    "industry": self.industry,
+                    "region": self.region,
+                }
+                for comp in competitors[:4]
+            ),
+            market_overview,
+        ]
 
 
 # ANALYSIS TOOLS
 
 
+def _trend_kernel(current_value: float, previous_value: float, periods: int) -> tuple[float, float, float]:
+    """Numeric core of the trend calculation, kept free of string and dict work for batch callers."""
+    growth_rate = (current_value - previous_value) / previous_value if previous_value != 0 else 0
+    momentum_score = min(abs(growth_rate) * 10, 10)  # Scale 0-10
+    projected_value = current_value * (1 + growth_rate) ** periods
+    return growth_rate, momentum_score, projected_value
+
+
 def calculate_trend_analysis(current_value: float, previous_value: float, periods: int = 4) -> dict[str, float | str]:
     """
     Calculate trend metrics including growth rate, momentum, and projections.
@@ -222,9 +270,7 @@ def calculate_trend_analysis(current_value: float, previous_value: float, period
     Returns:
         Dictionary with trend analysis metrics
     """
-    growth_rate = (current_value - previous_value) / previous_value if previous_value != 0 else 0
-    momentum_score = min(abs(growth_rate) * 10, 10)  # Scale 0-10
-    projected_value = current_value * (1 + growth_rate) ** periods
+    growth_rate, momentum_score, projected_value = _trend_kernel(current_value, previous_value, periods)
 
     return {
         "growth_rate": growth_rate,
@@ -234,6 +280,11 @@ def calculate_trend_analysis(current_value: float, previous_value: float, period
     }
 
 
+def _risk_kernel(churn: float, error_rate: float, churn_threshold: float, error_threshold: float) -> tuple[bool, bool]:
+    """Numeric core of the risk assessment; the wrapper turns the flags into report strings."""
+    return churn > churn_threshold, error_rate > error_threshold
+
+
 def assess_risk_factors(metrics: dict[str, float], thresholds: dict[str, float] | None = None) -> dict[str, str]:
     """
     Assess business risk factors based on key metrics.
@@ -252,7 +303,9 @@ def assess_risk_factors(metrics: dict[str, float], thresholds: dict[str, float]
 
     # Assess churn risk
     churn = metrics.get("churn_rate", 0)
-    if churn > thresholds["churn_rate"]:
+    error_rate = metrics.get("error_rate", 0)
+    churn_flag, error_flag = _risk_kernel(churn, error_rate, thresholds["churn_rate"], thresholds["error_rate"])
+    if churn_flag:
         risks["customer_retention"] = (
             f"HIGH - Churn rate of {churn:.1%} exceeds {thresholds['churn_rate']:.1%} threshold"
         )
@@ -260,8 +313,7 @@ def assess_risk_factors(metrics: dict[str, float], thresholds: dict[str, float]
         risks["customer_retention"] = f"LOW - Churn rate of {churn:.1%} is within acceptable range"
 
     # Assess technical risk
-    error_rate = metrics.get("error_rate", 0)
-    if error_rate > thresholds["error_rate"]:
+    if error_flag:
         risks["technical_stability"] = f"MEDIUM - Error rate of {error_rate:.2%} requires monitoring"
     else:
         risks["technical_stability"] = f"LOW - Error rate of {error_rate:.2%} is acceptable"
@@ -282,14 +334,22 @@ def generate_statistical_summary(data_points: list[float]) -> dict[str, float |
     if not data_points:
         return {"error": "No data points provided"}
 
+    n = len(data_points)
+    ordered = sorted(data_points)
+    mean = sum(ordered) / n
+    mid = n // 2
+    median = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+    std_dev = (sum((x - mean) ** 2 for x in ordered) / (n - 1)) ** 0.5 if n > 1 else 0
+    min_value, max_value = ordered[0], ordered[-1]
+
     return {
-        "mean": statistics.mean(data_points),
-        "median": statistics.median(data_points),
-        "std_dev": statistics.stdev(data_points) if len(data_points) > 1 else 0,
-        "min_value": min(data_points),
-        "max_value": max(data_points),
-        "range": max(data_points) - min(data_points),
-        "count": len(data_points),
+        "mean": mean,
+        "median": median,
+        "std_dev": std_dev,
+        "min_value": min_value,
+        "max_value": max_value,
+        "range": max_value - min_value,
+        "count": n,
     }
 
 
@@ -306,81 +366,124 @@ class BusinessContext(Context):
         self.analyst_name = analyst_name
         self.review_date = datetime.now().strftime("%Y-%m-%d")
 
+    # Dedented once at class definition so render only fills placeholders
+    _TEMPLATE = dedent("""\
+        Business Review Context:
+        Company: {company_name}
+        Review Period: {quarter} {year}
+        Analysis Date: {review_date}
+        Analyst: {analyst_name}
+
+        This analysis combines operational metrics, technical performance data, and market intelligence
+        to provide comprehensive insights for strategic decision making.""")
+
     def render(self) -> str:
-        return dedent(f"""\
-            Business Review Context:
-            Company: {self.company_name}
-            Review Period: {self.quarter} {self.year}
-            Analysis Date: {self.review_date}
-            Analyst: {self.analyst_name}
-            
-            This analysis combines operational metrics, technical performance data, and market intelligence 
-            to provide comprehensive insights for strategic decision making.
-            """).strip()
+        return self._TEMPLATE.format(
+            company_name=self.company_name,
+            quarter=self.quarter,
+            year=self.year,
+            review_date=self.review_date,
+            analyst_name=self.analyst_name,
+        )
 
 
 # CUSTOM PROMPT SECTIONS
 
 
+# The metrics report layout is shared by every section that renders business
+# metrics; dedented once here and memoized per unique metrics payload
+_METRICS_REPORT_TPL = dedent("""\
+    ## Business Metrics Report - {quarter}
+    **Department Scope:** {department}
+    **Generated:** {generated_at}
+
+    ### Financial Performance
+    - **Revenue:** ${revenue}
+    - **Monthly Recurring Revenue:** ${monthly_recurring_revenue}
+    - **Customer Acquisition Cost:** ${customer_acquisition_cost}
+
+    ### Growth & Engagement
+    - **User Growth Rate:** {user_growth_rate}
+    - **Active Users:** {active_users}
+    - **Conversion Rate:** {conversion_rate}
+    - **Churn Rate:** {churn_rate}
+
+    ### Operational Excellence
+    - **Net Promoter Score:** {net_promoter_score}
+    - **Server Uptime:** {server_uptime}
+    - **Avg Support Resolution:** {support_ticket_resolution_time} hours""")
+
+# Bound once at import; the cached formatter below just calls it
+_fill_metrics_report = _METRICS_REPORT_TPL.format
+
+
+@lru_cache(maxsize=64)
+def _format_metrics_items(items: tuple) -> str:
+    """Fill the metrics template for a frozen items tuple, cached per unique payload."""
+    # Numeric fields are formatted exactly once per payload; the template then
+    # does plain substitution with no per-field format-spec parsing
+    metrics = dict(items)
+    return _fill_metrics_report(
+        **{
+            **metrics,
+            "revenue": _fmt_int(metrics["revenue"]),
+            "monthly_recurring_revenue": _fmt_int(metrics["monthly_recurring_revenue"]),
+            "active_users": _fmt_int(metrics["active_users"]),
+            "user_growth_rate": f"{metrics['user_growth_rate']:.1%}",
+            "conversion_rate": f"{metrics['conversion_rate']:.1%}",
+            "churn_rate": f"{metrics['churn_rate']:.1%}",
+            "server_uptime": f"{metrics['server_uptime']:.1%}",
+        }
+    )
+
+
+def format_metrics_report(metrics: dict) -> str:
+    """Format a business metrics dictionary into a readable report."""
+    return _format_metrics_items(tuple(sorted(metrics.items())))
+
+
 class ExecutiveSummarySection(PromptSection):
     """Creates executive-level summary focused on key business outcomes."""
 
-    def _format_metrics_data(self, metrics: dict) -> str:
-        """Format metrics dictionary into a readable report."""
-        return dedent(f"""\
-            ## Business Metrics Report - {metrics["quarter"]}
-            **Department Scope:** {metrics["department"]}
-            **Generated:** {metrics["generated_at"]}
-
-            ### Financial Performance
-            - **Revenue:** ${metrics["revenue"]:,}
-            - **Monthly Recurring Revenue:** ${metrics["monthly_recurring_revenue"]:,}
-            - **Customer Acquisition Cost:** ${metrics["customer_acquisition_cost"]}
-
-            ### Growth & Engagement  
-            - **User Growth Rate:** {metrics["user_growth_rate"]:.1%}
-            - **Active Users:** {metrics["active_users"]:,}
-            - **Conversion Rate:** {metrics["conversion_rate"]:.1%}
-            - **Churn Rate:** {metrics["churn_rate"]:.1%}
-
-            ### Operational Excellence
-            - **Net Promoter Score:** {metrics["net_promoter_score"]}
-            - **Server Uptime:** {metrics["server_uptime"]:.1%}
-            - **Avg Support Resolution:** {metrics["support_ticket_resolution_time"]} hours""").strip()
+    _format_metrics_data = staticmethod(format_metrics_report)
 
-    def formatter(self, focus_areas: list[str] | None = None) -> str:
-        focus_areas = focus_areas or ["revenue", "growth", "performance"]
+    _TEMPLATE = dedent("""\
+        ## EXECUTIVE SUMMARY ANALYSIS
 
-        # Collect data from providers - only handle MetricsAPIProvider
-        formatted_data = []
-        for provider in self.providers:
-            if isinstance(provider, MetricsAPIProvider):
-                metrics = provider.run()
-                formatted_data.append(self._format_metrics_data(metrics))
+        You are conducting a quarterly executive briefing for senior leadership. Your analysis should be:
+        - **Strategic**: Focus on high-level business impact and strategic implications
+        - **Concise**: Summarize complex data into actionable insights
+        - **Forward-looking**: Include trends and recommendations for next quarter
 
-        # Ensure consistent indentation for dedent to work properly
-        data = "\n\n".join(formatted_data)
-        data = indent(data, INDENT_12)
-        tools_desc = ", ".join(tool.tool_name for tool in self.tools)
-        focus_list = "\n".join(f"• {area}" for area in focus_areas)
-        focus_list = indent(focus_list, INDENT_12)
+        ### Key Focus Areas:
+        {focus_list}
+
+        ### Available Data Sources:
+        {data}
+
+        ### Analysis Tools Available:
+        {tools_desc}
 
-        return dedent(f"""\
-            ## EXECUTIVE SUMMARY ANALYSIS
+        Please provide an executive summary that highlights the most critical findings, identifies key trends, and recommends strategic actions. Structure your response with clear sections for Performance Highlights, Key Challenges, and Strategic Recommendations.""")
 
-            You are conducting a quarterly executive briefing for senior leadership. Your analysis should be:
-            - **Strategic**: Focus on high-level business impact and strategic implications
-            - **Concise**: Summarize complex data into actionable insights
-            - **Forward-looking**: Include trends and recommendations for next quarter
+    # Bound once at class creation so render pays one call, not an attribute
+    # lookup plus method binding per template fill
+    _fill = staticmethod(_TEMPLATE.format)
 
-            ### Key Focus Areas:\n{focus_list}
+    def formatter(self, focus_areas: list[str] | None = None) -> str:
+        focus_areas = focus_areas or ["revenue", "growth", "performance"]
 
-            ### Available Data Sources:\n{data}
+        # Providers are pre-bucketed by concrete type, so no isinstance scans
+        formatted_data = [
+            self._format_metrics_data(provider.cached_run()) for provider in self.providers_of_type(MetricsAPIProvider)
+        ]
 
-            ### Analysis Tools Available:
-            {tools_desc}
+        # Placeholders sit at column 0 in the pre-dedented template, so the
+        # indent-for-dedent round trip is no longer needed
+        data = "\n\n".join(formatted_data)
+        focus_list = "\n".join(f"• {area}" for area in focus_areas)
 
-            Please provide an executive summary that highlights the most critical findings, identifies key trends, and recommends strategic actions. Structure your response with clear sections for Performance Highlights, Key Challenges, and Strategic Recommendations.""").strip()
+        return self._fill(focus_list=focus_list, data=data, tools_desc=self.tools_desc)
 
     def render(self) -> str:
         return self.formatter()
@@ -389,70 +492,51 @@ class ExecutiveSummarySection(PromptSection):
 class TechnicalAnalysisSection(PromptSection):
     """Detailed technical performance analysis for engineering and operations teams."""
 
-    def _format_metrics_data(self, metrics: dict) -> str:
-        """Format metrics dictionary into a readable report."""
-        return dedent(f"""\
-            ## Business Metrics Report - {metrics["quarter"]}
-            **Department Scope:** {metrics["department"]}
-            **Generated:** {metrics["generated_at"]}
-
-            ### Financial Performance
-            - **Revenue:** ${metrics["revenue"]:,}
-            - **Monthly Recurring Revenue:** ${metrics["monthly_recurring_revenue"]:,}
-            - **Customer Acquisition Cost:** ${metrics["customer_acquisition_cost"]}
-
-            ### Growth & Engagement  
-            - **User Growth Rate:** {metrics["user_growth_rate"]:.1%}
-            - **Active Users:** {metrics["active_users"]:,}
-            - **Conversion Rate:** {metrics["conversion_rate"]:.1%}
-            - **Churn Rate:** {metrics["churn_rate"]:.1%}
-
-            ### Operational Excellence
-            - **Net Promoter Score:** {metrics["net_promoter_score"]}
-            - **Server Uptime:** {metrics["server_uptime"]:.1%}
-            - **Avg Support Resolution:** {metrics["support_ticket_resolution_time"]} hours""").strip()
+    _format_metrics_data = staticmethod(format_metrics_report)
 
-    def formatter(self, metrics_focus: list[str] | None = None) -> str:
-        metrics_focus = metrics_focus or ["performance", "reliability", "scalability", "efficiency"]
+    _TEMPLATE = dedent("""\
+        ## TECHNICAL PERFORMANCE DEEP DIVE
 
-        # Collect data from providers - handle specific provider types
-        formatted_data = []
-        for provider in self.providers:
-            if isinstance(provider, MetricsAPIProvider):
-                metrics = provider.run()
-                formatted_data.append(self._format_metrics_data(metrics))
-            elif isinstance(provider, LogAnalysisProvider):
-                log_report = provider.run()
-                formatted_data.append(log_report)
-
-        # Ensure consistent indentation for dedent to work properly
-        data = "\n\n".join(formatted_data)
-        data = indent(data, INDENT_12)
-        tools_info = "\n".join(f"- {tool.tool_name}: {tool.tool_description}" for tool in self.tools)
-        tools_info = indent(tools_info, INDENT_12)
-        metrics_scope = "\n".join(f"• {metric.title()}" for metric in metrics_focus)
-        metrics_scope = indent(metrics_scope, INDENT_12)
+        Conduct a comprehensive technical analysis focusing on system performance, reliability, and operational excellence. This analysis will inform technical roadmap decisions and infrastructure planning.
 
-        return dedent(f"""\
-            ## TECHNICAL PERFORMANCE DEEP DIVE
+        ### Technical Analysis Scope:
+        {metrics_scope}
 
-            Conduct a comprehensive technical analysis focusing on system performance, reliability, and operational excellence. This analysis will inform technical roadmap decisions and infrastructure planning.
+        ### System Data Available:
+        {data}
 
-            ### Technical Analysis Scope:\n{metrics_scope}
+        ### Analysis Capabilities:
+        {tools_info}
 
-            ### System Data Available:\n{data}
+        Provide a detailed technical assessment covering:
+        1. **Performance Metrics Analysis**: Response times, throughput, error rates
+        2. **Reliability Assessment**: Uptime, failure patterns, recovery times
+        3. **Scalability Review**: Capacity utilization, bottlenecks, growth readiness
+        4. **Operational Efficiency**: Resource utilization, cost optimization opportunities
+        5. **Technical Risk Assessment**: Security, stability, and maintenance concerns
+        6. **Infrastructure Recommendations**: Improvements for next quarter
 
-            ### Analysis Capabilities:\n{tools_info}
+        Use quantitative analysis where possible and provide specific technical recommendations.""")
 
-            Provide a detailed technical assessment covering:
-            1. **Performance Metrics Analysis**: Response times, throughput, error rates
-            2. **Reliability Assessment**: Uptime, failure patterns, recovery times  
-            3. **Scalability Review**: Capacity utilization, bottlenecks, growth readiness
-            4. **Operational Efficiency**: Resource utilization, cost optimization opportunities
-            5. **Technical Risk Assessment**: Security, stability, and maintenance concerns
-            6. **Infrastructure Recommendations**: Improvements for next quarter
+    # Bound once at class creation so render pays one call, not an attribute
+    # lookup plus method binding per template fill
+    _fill = staticmethod(_TEMPLATE.format)
 
-            Use quantitative analysis where possible and provide specific technical recommendations.""").strip()
+    def formatter(self, metrics_focus: list[str] | None = None) -> str:
+        metrics_focus = metrics_focus or ["performance", "reliability", "scalability", "efficiency"]
+
+        # Providers are pre-bucketed by concrete type, so no isinstance scans
+        formatted_data = [
+            self._format_metrics_data(provider.cached_run()) for provider in self.providers_of_type(MetricsAPIProvider)
+        ]
+        formatted_data.extend(provider.cached_run() for provider in self.providers_of_type(LogAnalysisProvider))
+
+        # Placeholders sit at column 0 in the pre-dedented template, so the
+        # indent-for-dedent round trip is no longer needed
+        data = "\n\n".join(formatted_data)
+        metrics_scope = "\n".join(f"• {metric.title()}" for metric in metrics_focus)
+
+        return self._fill(metrics_scope=metrics_scope, data=data, tools_info=self.tools_info)
 
     def render(self) -> str:
         return self.formatter()
@@ -461,84 +545,64 @@ class TechnicalAnalysisSection(PromptSection):
 class RecommendationsSection(PromptSection):
     """Strategic recommendations and action items based on comprehensive analysis."""
 
-    def _format_metrics_data(self, metrics: dict) -> str:
-        """Format metrics dictionary into a readable report."""
-        return dedent(f"""\
-            ## Business Metrics Report - {metrics["quarter"]}
-            **Department Scope:** {metrics["department"]}
-            **Generated:** {metrics["generated_at"]}
-
-            ### Financial Performance
-            - **Revenue:** ${metrics["revenue"]:,}
-            - **Monthly Recurring Revenue:** ${metrics["monthly_recurring_revenue"]:,}
-            - **Customer Acquisition Cost:** ${metrics["customer_acquisition_cost"]}
-
-            ### Growth & Engagement  
-            - **User Growth Rate:** {metrics["user_growth_rate"]:.1%}
-            - **Active Users:** {metrics["active_users"]:,}
-            - **Conversion Rate:** {metrics["conversion_rate"]:.1%}
-            - **Churn Rate:** {metrics["churn_rate"]:.1%}
-
-            ### Operational Excellence
-            - **Net Promoter Score:** {metrics["net_promoter_score"]}
-            - **Server Uptime:** {metrics["server_uptime"]:.1%}
-            - **Avg Support Resolution:** {metrics["support_ticket_resolution_time"]} hours""").strip()
+    _format_metrics_data = staticmethod(format_metrics_report)
 
-    def formatter(self, time_horizon: str = "next quarter") -> str:
-        # Collect data from providers - handle specific provider types
-        formatted_data = []
-        for provider in self.providers:
-            if isinstance(provider, MetricsAPIProvider):
-                metrics = provider.run()
-                formatted_data.append(self._format_metrics_data(metrics))
-            elif isinstance(provider, LogAnalysisProvider):
-                log_report = provider.run()
-                formatted_data.append(log_report)
-
-        # Ensure consistent indentation for dedent to work properly
-        data = "\n\n".join(formatted_data)
-        data = indent(data, INDENT_12)
-        available_tools = [f"• {tool.tool_name} (for {tool.tool_description.lower()})" for tool in self.tools]
-        tools_list = "\n".join(available_tools)
-        tools_list = indent(tools_list, INDENT_12)
+    _TEMPLATE = dedent("""\
+        ## STRATEGIC RECOMMENDATIONS & ACTION PLANNING
 
-        return dedent(f"""\
-            ## STRATEGIC RECOMMENDATIONS & ACTION PLANNING
+        Based on the comprehensive analysis of business metrics and technical performance data, provide actionable recommendations for {time_horizon}. Your recommendations should be:
 
-            Based on the comprehensive analysis of business metrics and technical performance data, provide actionable recommendations for {time_horizon}. Your recommendations should be:
+        - **Prioritized**: Rank by impact and feasibility
+        - **Specific**: Include concrete actions and success metrics
+        - **Resource-aware**: Consider implementation complexity and requirements
+        - **Measurable**: Define clear KPIs for tracking progress
 
-            - **Prioritized**: Rank by impact and feasibility
-            - **Specific**: Include concrete actions and success metrics
-            - **Resource-aware**: Consider implementation complexity and requirements
-            - **Measurable**: Define clear KPIs for tracking progress
+        ### Data Foundation:
+        {data}
 
-            ### Data Foundation:\n{data}
+        ### Analysis Tools Used:
+        {tools_list}
 
-            ### Analysis Tools Used:\n{tools_list}
+        Structure your recommendations as follows:
 
-            Structure your recommendations as follows:
+        ### 1. HIGH PRIORITY ACTIONS (Immediate - 30 days)
+        Identify 3-5 critical actions that need immediate attention
 
-            ### 1. HIGH PRIORITY ACTIONS (Immediate - 30 days)
-            Identify 3-5 critical actions that need immediate attention
+        ### 2. STRATEGIC INITIATIVES (Medium term - 90 days)
+        Outline 3-4 strategic projects for the quarter
 
-            ### 2. STRATEGIC INITIATIVES (Medium term - 90 days)  
-            Outline 3-4 strategic projects for the quarter
+        ### 3. LONG-TERM INVESTMENTS (6+ months)
+        Suggest 2-3 major initiatives for future planning
 
-            ### 3. LONG-TERM INVESTMENTS (6+ months)
-            Suggest 2-3 major initiatives for future planning
+        ### 4. RISK MITIGATION
+        Address identified risks with specific mitigation strategies
 
-            ### 4. RISK MITIGATION
-            Address identified risks with specific mitigation strategies
+        ### 5. SUCCESS METRICS
+        Define measurable KPIs for tracking progress on each recommendation
 
-            ### 5. SUCCESS METRICS
-            Define measurable KPIs for tracking progress on each recommendation
+        For each recommendation, include:
+        - **Rationale**: Why this action is needed
+        - **Expected Impact**: Quantified benefits where possible
+        - **Implementation Complexity**: Low/Medium/High
+        - **Resource Requirements**: Team/budget/time estimates
+        - **Success Criteria**: How to measure success""")
 
-            For each recommendation, include:
-            - **Rationale**: Why this action is needed
-            - **Expected Impact**: Quantified benefits where possible
-            - **Implementation Complexity**: Low/Medium/High
-            - **Resource Requirements**: Team/budget/time estimates
-            - **Success Criteria**: How to measure success""").strip()
+    # Bound once at class creation so render pays one call, not an attribute
+    # lookup plus method binding per template fill
+    _fill = staticmethod(_TEMPLATE.format)
+
+    def formatter(self, time_horizon: str = "next quarter") -> str:
+        # Providers are pre-bucketed by concrete type, so no isinstance scans
+        formatted_data = [
+            self._format_metrics_data(provider.cached_run()) for provider in self.providers_of_type(MetricsAPIProvider)
+        ]
+        formatted_data.extend(provider.cached_run() for provider in self.providers_of_type(LogAnalysisProvider))
+
+        # Placeholders sit at column 0 in the pre-dedented template, so the
+        # indent-for-dedent round trip is no longer needed
+        data = "\n\n".join(formatted_data)
+
+        return self._fill(time_horizon=time_horizon, data=data, tools_list=self.tools_list)
 
     def render(self) -> str:
         return self.formatter()
@@ -547,68 +611,163 @@ class RecommendationsSection(PromptSection):
 class CompetitiveAnalysisSection(PromptSection):
     """Specialized section for competitive intelligence and market positioning analysis."""
 
+    # Dedented once at class definition so each call only fills placeholders
+    _COMPETITOR_TPL = dedent("""\
+        ### {company}
+        - **Market Share:** {market_share:.1%}
+        - **Revenue:** ${revenue_estimate}M (estimated)
+        - **Employees:** {employee_count:,}
+        - **Founded:** {founded_year}
+        - **Focus:** {primary_focus}
+        - **Growth Rate:** {growth_rate:.1%}
+        - **Status:** {status} ({funding_round})""")
+
+    _fill_competitor = staticmethod(_COMPETITOR_TPL.format)
+
+    _MARKET_TPL = dedent("""\
+        ## Comprehensive Competitive Intelligence Report
+        **Industry:** {industry}
+        **Region:** {region}
+        **Analysis Date:** {analysis_date}
+
+        ### Market Landscape Overview
+        - **Total Addressable Market:** ${total_market_size}B annually
+        - **Market Growth Rate:** {industry_growth_rate:.1%} year-over-year
+        - **Industry Maturity:** {maturity}
+        - **Competitive Intensity:** {intensity}
+
+        ### Our Position
+        - **Market Share:** {our_market_share:.1%}
+        - **Revenue:** ${our_revenue}M
+        - **Employees:** {our_employees:,}
+        - **Growth Rate:** {our_growth:.1%}
+        - **Competitive Advantage:** {our_advantage}
+
+        ### Detailed Competitor Analysis:
+        {competitor_details}
+
+        ### Market Trends & Drivers:
+        {trends_analysis}
+
+        ### Competitive Positioning Insights
+        - **Market Leaders:** {market_leaders}
+        - **Growth Champions:** {growth_champions}
+        - **Public Companies:** {public_companies}
+        - **Funding Leaders:** {funding_leaders}""")
+
+    _fill_market = staticmethod(_MARKET_TPL.format)
+
+    # Funding rounds that qualify a competitor as a funding leader
+    _FUNDING_LEADER_ROUNDS = frozenset({"Series C", "IPO"})
+
     def _format_market_data(self, market_data: list[dict]) -> str:
         """Format detailed competitive analysis from market data."""
-        # Find market overview data
-        market_overview = next((item for item in market_data if item.get("company") == "_MARKET_OVERVIEW_"), {})
-        our_company = next((item for item in market_data if item.get("company") == "Our Company"), {})
-        competitors = [item for item in market_data if item.get("company") not in ["_MARKET_OVERVIEW_", "Our Company"]]
+        # Partition the records in a single pass instead of scanning per category
+        market_overview: dict = {}
+        our_company: dict = {}
+        competitors: list[dict] = []
+        for item in market_data:
+            company = item.get("company")
+            if company == "_MARKET_OVERVIEW_":
+                market_overview = item
+            elif company == "Our Company":
+                our_company = item
+            else:
+                competitors.append(item)
 
         # Sort competitors by market share
         competitors.sort(key=lambda x: x.get("market_share", 0), reverse=True)
 
-        # Detailed competitor analysis
-        competitor_analysis = []
+        # One pass over the sorted competitors yields the detailed analysis and
+        # every positioning grouping, replacing four more scans
+        competitor_rows: list[str] = []
+        growth_champions: list[str] = []
+        public_companies: list[str] = []
+        funding_leaders: list[str] = []
+        # Bound locals keep the per-competitor loop on fast-local lookups
+        add_row = competitor_rows.append
+        add_champion = growth_champions.append
+        add_public = public_companies.append
+        add_leader = funding_leaders.append
+        fill_competitor = self._fill_competitor
+        leader_rounds = self._FUNDING_LEADER_ROUNDS
         for comp in competitors:
-            analysis = dedent(f"""\
-                ### {comp["company"]}
-                - **Market Share:** {comp["market_share"]:.1%}
-                - **Revenue:** ${comp["revenue_estimate"]}M (estimated)
-                - **Employees:** {comp["employee_count"]:,}
-                - **Founded:** {comp["founded_year"]}
-                - **Focus:** {comp["primary_focus"]}
-                - **Growth Rate:** {comp["growth_rate"]:.1%}
-                - **Status:** {"Public" if comp["is_public"] else "Private"} ({comp["funding_round"]})""").strip()
-            competitor_analysis.append(analysis)
-
-        competitor_details = "\n\n".join(competitor_analysis)
+            add_row(fill_competitor(**comp, status="Public" if comp["is_public"] else "Private"))
+            name = comp["company"]
+            if comp.get("growth_rate", 0) > 0.20:
+                add_champion(name)
+            if comp.get("is_public"):
+                add_public(name)
+            if comp.get("funding_round") in leader_rounds:
+                add_leader(name)
+        competitor_details = "\n\n".join(competitor_rows)
 
         # Format major trends
         trends = market_overview.get("major_trends", [])
         trends_analysis = "\n".join([f"- **{trend}:** Key driver of market evolution" for trend in trends])
 
-        # Ensure consistent indentation for dedent to work properly
-        competitor_details = indent(competitor_details, INDENT_12)
-        trends_analysis = indent(trends_analysis, INDENT_12)
+        return self._fill_market(
+            industry=market_overview.get("industry", "Unknown"),
+            region=market_overview.get("region", "Unknown"),
+            analysis_date=market_overview.get("analysis_date", _now_str("%Y-%m-%d")),
+            total_market_size=market_overview.get("total_market_size", 0),
+            industry_growth_rate=market_overview.get("industry_growth_rate", 0),
+            maturity="Mature" if market_overview.get("industry_growth_rate", 0) < 0.10 else "Growth Stage",
+            intensity="High" if len(competitors) > 3 else "Moderate",
+            our_market_share=our_company.get("market_share", 0),
+            our_revenue=our_company.get("revenue_estimate", 0),
+            our_employees=our_company.get("employee_count", 0),
+            our_growth=our_company.get("growth_rate", 0),
+            our_advantage=our_company.get("primary_focus", "AI-Powered Analytics"),
+            competitor_details=competitor_details,
+            trends_analysis=trends_analysis,
+            market_leaders=", ".join([comp["company"] for comp in competitors[:2]]),
+            growth_champions=", ".join(growth_champions),
+            public_companies=", ".join(public_companies),
+            funding_leaders=", ".join(funding_leaders),
+        )
+
+    _TEMPLATE = dedent("""\
+        ## COMPETITIVE INTELLIGENCE & MARKET POSITIONING ANALYSIS
+
+        You are conducting a comprehensive competitive analysis for strategic planning. Your analysis should be:
+        - **Data-Driven**: Use quantitative metrics to support positioning decisions
+        - **Strategic**: Identify competitive advantages and vulnerabilities
+        - **Actionable**: Provide clear recommendations for competitive response
+        - **Forward-Looking**: Anticipate market shifts and competitor moves
+
+        ### Analysis Focus Areas:
+        {focus_list}
+
+        ### Competitive Intelligence Data:
+        {data}
 
-        return dedent(f"""\
-            ## Comprehensive Competitive Intelligence Report
-            **Industry:** {market_overview.get("industry", "Unknown")}
-            **Region:** {market_overview.get("region", "Unknown")}
-            **Analysis Date:** {market_overview.get("analysis_date", datetime.now().strftime("%Y-%m-%d"))}
+        ### Analysis Tools Available:
+        {tools_desc}
 
-            ### Market Landscape Overview
-            - **Total Addressable Market:** ${market_overview.get("total_market_size", 0)}B annually
-            - **Market Growth Rate:** {market_overview.get("industry_growth_rate", 0):.1%} year-over-year
-            - **Industry Maturity:** {"Mature" if market_overview.get("industry_growth_rate", 0) < 0.10 else "Growth Stage"}
-            - **Competitive Intensity:** {"High" if len(competitors) > 3 else "Moderate"}
+        Provide a detailed competitive analysis covering:
 
-            ### Our Position
-            - **Market Share:** {our_company.get("market_share", 0):.1%}
-            - **Revenue:** ${our_company.get("revenue_estimate", 0)}M
-            - **Employees:** {our_company.get("employee_count", 0):,}
-            - **Growth Rate:** {our_company.get("growth_rate", 0):.1%}
-            - **Competitive Advantage:** {our_company.get("primary_focus", "AI-Powered Analytics")}
+        ### 1. COMPETITIVE POSITIONING
+        Analyze our market position relative to key competitors
 
-            ### Detailed Competitor Analysis:\n{competitor_details}
+        ### 2. THREAT ASSESSMENT
+        Identify immediate and emerging competitive threats
 
-            ### Market Trends & Drivers:\n{trends_analysis}
+        ### 3. OPPORTUNITY ANALYSIS
+        Highlight market gaps and growth opportunities
 
-            ### Competitive Positioning Insights
-            - **Market Leaders:** {", ".join([comp["company"] for comp in competitors[:2]])}
-            - **Growth Champions:** {", ".join([comp["company"] for comp in competitors if comp.get("growth_rate", 0) > 0.20])}
-            - **Public Companies:** {", ".join([comp["company"] for comp in competitors if comp.get("is_public")])}
-            - **Funding Leaders:** {", ".join([comp["company"] for comp in competitors if comp.get("funding_round") in ["Series C", "IPO"]])}""").strip()
+        ### 4. DIFFERENTIATION STRATEGY
+        Recommend how to strengthen competitive advantages
+
+        ### 5. COMPETITIVE RESPONSE PLAN
+        Outline tactical responses to competitor actions
+
+        ### 6. MARKET INTELLIGENCE PRIORITIES
+        Identify key metrics and competitors to monitor closely""")
+
+    # Bound once at class creation so render pays one call, not an attribute
+    # lookup plus method binding per template fill
+    _fill = staticmethod(_TEMPLATE.format)
 
     def formatter(self, analysis_focus: list[str] | None = None) -> str:
         analysis_focus = analysis_focus or [
@@ -618,68 +777,62 @@ class CompetitiveAnalysisSection(PromptSection):
             "differentiation",
         ]
 
-        # Collect data from providers - handle specific provider types
-        formatted_data = []
-        for provider in self.providers:
-            if isinstance(provider, MarketDataProvider):
-                market_data = provider.run()
-                formatted_data.append(self._format_market_data(market_data))
-            elif isinstance(provider, MetricsAPIProvider):
-                metrics = provider.run()
-                formatted_data.append(
-                    f"**{metrics.get('quarter', 'Current Period')} Metrics:** Revenue ${metrics.get('revenue', 0):,}, Growth {metrics.get('user_growth_rate', 0):.1%}"
-                )
-
-        # Ensure consistent indentation for dedent to work properly
+        # Providers are pre-bucketed by concrete type, so no isinstance scans
+        formatted_data = [
+            self._format_market_data(provider.cached_run()) for provider in self.providers_of_type(MarketDataProvider)
+        ]
+        for provider in self.providers_of_type(MetricsAPIProvider):
+            metrics = provider.cached_run()
+            formatted_data.append(
+                f"**{metrics.get('quarter', 'Current Period')} Metrics:** Revenue ${metrics.get('revenue', 0):,}, Growth {metrics.get('user_growth_rate', 0):.1%}"
+            )
+
+        # Placeholders sit at column 0 in the pre-dedented template, so the
+        # indent-for-dedent round trip is no longer needed
         data = "\n\n".join(formatted_data)
-        data = indent(data, INDENT_12)
-        tools_desc = ", ".join(tool.tool_name for tool in self.tools)
         focus_list = "\n".join(f"• {area}" for area in analysis_focus)
-        focus_list = indent(focus_list, INDENT_12)
-
-        return dedent(f"""\
-            ## COMPETITIVE INTELLIGENCE & MARKET POSITIONING ANALYSIS
 
-            You are conducting a comprehensive competitive analysis for strategic planning. Your analysis should be:
-            - **Data-Driven**: Use quantitative metrics to support positioning decisions
-            - **Strategic**: Identify competitive advantages and vulnerabilities
-            - **Actionable**: Provide clear recommendations for competitive response
-            - **Forward-Looking**: Anticipate market shifts and competitor moves
+        return self._fill(focus_list=focus_list, data=data, tools_desc=self.tools_desc)
 
-            ### Analysis Focus Areas:
-{focus_list}
+    def render(self) -> str:
+        return self.formatter()
 
-            ### Competitive Intelligence Data:
-{data}
 
-            ### Analysis Tools Available:
-            {tools_desc}
+# CUSTOM PROMPT
 
-            Provide a detailed competitive analysis covering:
+# Header/footer prose is static, so both scaffolds are dedented once at import
+# time and only their placeholders are filled per prompt instance
+_QBR_HEADER_TMPL = dedent("""\
+    # QUARTERLY BUSINESS REVIEW: {company_name}
+    ## {quarter} {year} Comprehensive Analysis
 
-            ### 1. COMPETITIVE POSITIONING
-            Analyze our market position relative to key competitors
+    **Generated:** {generated_at}
+    **Analysis Type:** Multi-dimensional Business Intelligence Review
+    **Scope:** Operational Performance, Technical Metrics, Market Position
 
-            ### 2. THREAT ASSESSMENT  
-            Identify immediate and emerging competitive threats
+    ---
 
-            ### 3. OPPORTUNITY ANALYSIS
-            Highlight market gaps and growth opportunities
+    This comprehensive quarterly review integrates business metrics, technical performance data, and competitive market intelligence to provide actionable insights for strategic decision-making. The analysis is structured in three complementary sections: Executive Summary for leadership decisions, Technical Deep Dive for operational excellence, and Strategic Recommendations for forward planning.
 
-            ### 4. DIFFERENTIATION STRATEGY
-            Recommend how to strengthen competitive advantages
+    Please analyze all provided data sources thoroughly and deliver insights that are data-driven, actionable, and aligned with business objectives. Consider both short-term tactical adjustments and long-term strategic positioning in your analysis.""").strip()
 
-            ### 5. COMPETITIVE RESPONSE PLAN
-            Outline tactical responses to competitor actions
+_QBR_FOOTER_TMPL = dedent(f"""\
+    {_BAR80}
 
-            ### 6. MARKET INTELLIGENCE PRIORITIES
-            Identify key metrics and competitors to monitor closely""").strip()
+    ## ANALYSIS FRAMEWORK SUMMARY
 
-    def render(self) -> str:
-        return self.formatter()
+    This prompt leverages the power of object-oriented prompt engineering to:
+    - **Integrate Multiple Data Sources**: Business APIs, system logs, and market research
+    - **Apply Specialized Analysis Tools**: Statistical analysis, trend calculation, and risk assessment
+    - **Structure Complex Analysis**: Executive, technical, and strategic perspectives
+    - **Ensure Consistency**: Standardized data formats and analysis approaches
+    - **Enable Reusability**: Modular components for different business contexts
 
+    The modular design allows for easy customization of data sources, analysis tools, and reporting sections while maintaining analytical rigor and consistency across quarterly reviews.
 
-# CUSTOM PROMPT
+    **Total Data Providers:** {{n_providers}}
+    **Analysis Tools:** {{n_tools}}
+    **Report Sections:** {{n_sections}}""").strip()
 
 
 class QuarterlyReviewPrompt(BasePrompt):
@@ -692,43 +845,43 @@ class QuarterlyReviewPrompt(BasePrompt):
         self.year = year
         self.generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    def render(self) -> str:
-        sections_content = "\n\n" + "=" * 80 + "\n\n".join(section.render() for section in self.sections)
-
-        header = dedent(f"""\
-            # QUARTERLY BUSINESS REVIEW: {self.company_name}
-            ## {self.quarter} {self.year} Comprehensive Analysis
-
-            **Generated:** {self.generated_at}
-            **Analysis Type:** Multi-dimensional Business Intelligence Review
-            **Scope:** Operational Performance, Technical Metrics, Market Position
-
-            ---
-
-            This comprehensive quarterly review integrates business metrics, technical performance data, and competitive market intelligence to provide actionable insights for strategic decision-making. The analysis is structured in three complementary sections: Executive Summary for leadership decisions, Technical Deep Dive for operational excellence, and Strategic Recommendations for forward planning.
-
-            Please analyze all provided data sources thoroughly and deliver insights that are data-driven, actionable, and aligned with business objectives. Consider both short-term tactical adjustments and long-term strategic positioning in your analysis.""").strip()
-
-        footer = dedent(f"""\
-
-            {"=" * 80}
-
-            ## ANALYSIS FRAMEWORK SUMMARY
-
-            This prompt leverages the power of object-oriented prompt engineering to:
-            - **Integrate Multiple Data Sources**: Business APIs, system logs, and market research
-            - **Apply Specialized Analysis Tools**: Statistical analysis, trend calculation, and risk assessment
-            - **Structure Complex Analysis**: Executive, technical, and strategic perspectives
-            - **Ensure Consistency**: Standardized data formats and analysis approaches
-            - **Enable Reusability**: Modular components for different business contexts
+        # Header, footer and their provider/tool counts are pure functions of
+        # constructor state, so fill the templates once here instead of per render call
+        self._header = _QBR_HEADER_TMPL.format(
+            company_name=self.company_name,
+            quarter=self.quarter,
+            year=self.year,
+            generated_at=self.generated_at,
+        )
+        # One pass over the sections covers both footer counters
+        n_providers = n_tools = 0
+        for section in self.sections:
+            n_providers += sum(1 for p in section.providers if p is not None)
+            n_tools += len(section.tools)
+        self._footer = _QBR_FOOTER_TMPL.format(
+            n_providers=n_providers,
+            n_tools=n_tools,
+            n_sections=len(self.sections),
+        )
 
-            The modular design allows for easy customization of data sources, analysis tools, and reporting sections while maintaining analytical rigor and consistency across quarterly reviews.
+    def render(self) -> str:
+        # Deduplicate by identity and pre-run, so a provider registered with
+        # several sections executes exactly once per render
+        providers = list({id(p): p for section in self.sections for p in section.providers if p is not None}.values())
+        for provider in providers:
+            provider.invalidate()
+        if providers:
+            # Providers model I/O-bound external calls, so fetch them concurrently:
+            # render latency becomes the slowest provider instead of the sum
+            with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+                # Drain the iterator so any provider exception surfaces here
+                list(executor.map(BaseProvider.cached_run, providers))
 
-            **Total Data Providers:** {len([p for section in self.sections for p in section.providers if p is not None])}
-            **Analysis Tools:** {len([t for section in self.sections for t in section.tools])}
-            **Report Sections:** {len(self.sections)}""").strip()
+        # Join over a materialized list with the full separator; the old
+        # expression only prefixed the rule onto the first section boundary
+        sections_content = _SECTION_SEP.join([section.render() for section in self.sections])
 
-        return header + sections_content + footer
+        return f"{self._header}{_SECTION_SEP}{sections_content}\n\n{self._footer}"
 
 
 # EXAMPLE EXECUTION
@@ -785,9 +938,9 @@ def main():
     )
 
     # Render and display the final prompt
-    print("\n" + "=" * 80)
+    print("\n" + _BAR80)
     print("GENERATED QUARTERLY REVIEW PROMPT")
-    print("=" * 80)
+    print(_BAR80)
 
     final_prompt = quarterly_prompt.render()
     print(final_prompt)
@@ -10,13 +10,18 @@ with proompt's PromptSection. It shows:
 - Using tools in a PromptSection
 """
 
-from textwrap import dedent, indent
+from textwrap import dedent
 
 from pydantic_ai import FunctionToolset, RunContext, Tool
 
 from proompt.base.context import ToolContext
 from proompt.base.prompt import BasePrompt, PromptSection
 
+# Output banners, built once instead of per print call
+_BAR80 = "=" * 80
+_RULE80 = "-" * 80
+_RULE40 = "-" * 40
+
 # ===== DEFINE SOME TOOLS USING PYDANTIC-AI =====
 
 
@@ -67,19 +72,24 @@ proompt_tool = ToolContext(format_report)
 # ===== CREATE A PROMPT SECTION WITH MIXED TOOLS =====
 
 
+# Section scaffolding is constant; dedent it once at import so formatter only
+# fills the tool listing
+_ANALYSIS_TEMPLATE = dedent("""\
+    ## ANALYSIS TOOLS
+
+    You have access to the following tools:
+
+    {tools_list}
+
+    Use these tools to gather and analyze data for your report.""")
+
+
 class AnalysisSection(PromptSection):
     """A section that uses both proompt and pydantic-ai tools."""
 
     def formatter(self) -> str:
-        tools_list = "\n" + "\n".join(f"- {tool.tool_name}: {tool.tool_description}" for tool in self.tools)
-        return dedent(f"""\
-            ## ANALYSIS TOOLS
-            
-            You have access to the following tools:
-            {indent(tools_list, " " * 12)}
-            
-            Use these tools to gather and analyze data for your report.
-            """).strip()
+        # tools_info is formatted once by PromptSection and reused until tools change
+        return _ANALYSIS_TEMPLATE.format(tools_list=self.tools_info)
 
     def render(self) -> str:
         return self.formatter()
@@ -92,28 +102,28 @@ class MixedToolsPrompt(BasePrompt):
     """Example prompt using both proompt and pydantic-ai tools."""
 
     def render(self) -> str:
-        return "\n\n".join(section.render() for section in self.sections)
+        return self.render_sections()
 
 
 # ===== DEMONSTRATE THE INTEGRATION =====
 
 
 def main():
-    print("=" * 80)
+    print(_BAR80)
     print("Pydantic-AI Tools Integration Demo")
-    print("=" * 80)
+    print(_BAR80)
     print()
 
     # Method 1: Pass individual pydantic-ai Tool objects
     print("Method 1: Individual Tool objects")
-    print("-" * 80)
+    print(_RULE80)
     section1 = AnalysisSection(tools=[search_tool, metrics_tool, calc_tool])
     print(f"Tools in section: {len(section1.tools)}")
     print()
 
     # Method 2: Pass a FunctionToolset (tools are extracted automatically)
     print("Method 2: FunctionToolset")
-    print("-" * 80)
+    print(_RULE80)
     section2 = AnalysisSection(tools=[analysis_toolset])
     print(f"Tools in section: {len(section2.tools)}")
     print("Tool names:", [t.tool_name for t in section2.tools])
@@ -121,7 +131,7 @@ def main():
 
     # Method 3: Mix ToolContext and pydantic-ai tools
     print("Method 3: Mixed tools (ToolContext + pydantic-ai Tool + FunctionToolset)")
-    print("-" * 80)
+    print(_RULE80)
     section3 = AnalysisSection(
         tools=[
             proompt_tool,  # Traditional proompt tool
@@ -135,14 +145,14 @@ def main():
 
     # Create a full prompt
     print("Full Prompt Output:")
-    print("=" * 80)
+    print(_BAR80)
     prompt = MixedToolsPrompt(section3)
     print(prompt.render())
     print()
 
     # Demonstrate add_tools method
     print("Using add_tools method:")
-    print("-" * 80)
+    print(_RULE80)
     section4 = AnalysisSection()
     print(f"Initial tools: {len(section4.tools)}")
 
@@ -160,10 +170,10 @@ def main():
 
     # Show tool rendering
     print("Individual Tool Rendering:")
-    print("=" * 80)
+    print(_BAR80)
     for tool in section3.tools[:3]:  # Show first 3 tools
         print(f"\n{tool.tool_name}:")
-        print("-" * 40)
+        print(_RULE40)
         print(tool)  # automatically uses __str__() to render
 
 
@@ -1,7 +1,8 @@
 import inspect
 from abc import ABC, abstractmethod
+from collections import deque
 from textwrap import dedent
-from typing import Callable
+from typing import Callable, ClassVar
 
 from pydantic_ai.tools import Tool
 from pydantic_ai.toolsets import FunctionToolset
@@ -15,6 +16,8 @@ class Context(ABC):
         render: abstract method to be defined in concrete class to generate string; also aliased using `str()`
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def render(self) -> str:
         """Render the context as a string."""
@@ -36,19 +39,34 @@ class ToolContext(Context):
         tool_args (MappingProxytype): Arguments accepted by the tool.
         output_type (Any): Expected output type of the tool.
 
+    Properties:
+        summary_line (str): one-line `- name: description` summary, formatted once per instance
+
     Methods:
         args_render: renders text for tool arguments
         render: generates string information for tool context, also aliased using `str()`
     """
 
+    __slots__ = ("_summary_line", "_tool", "output_type", "tool_args", "tool_description", "tool_name", "tool_use")
+
     def __init__(self, tool: Callable, tool_use: str | None = None) -> None:
         """Initialize the ToolContext with a tool function."""
         self._tool = tool
         self.tool_use = tool_use or "Reference description for usage."
         self.tool_name = tool.__name__
         self.tool_description = tool.__doc__ or "No description available."
-        self.tool_args = inspect.signature(tool).parameters
-        self.output_type = inspect.signature(tool).return_annotation
+        sig = inspect.signature(tool)  # resolved once; signature() re-parses per call
+        self.tool_args = sig.parameters
+        self.output_type = sig.return_annotation
+        self._summary_line: str | None = None
+
+    @property
+    def summary_line(self) -> str:
+        """Get the `- name: description` summary line; formatted once per instance."""
+        line = self._summary_line
+        if line is None:
+            line = self._summary_line = f"- {self.tool_name}: {self.tool_description}"
+        return line
 
     @classmethod
     def from_pydantic_tool(cls, tool: Tool) -> "ToolContext":
@@ -80,30 +98,98 @@ class ToolContext(Context):
         Returns:
             List of ToolContext instances (may be empty)
         """
-        result: list[ToolContext] = []
+        handler = cls._normalize_dispatch.get(type(tool))
+        if handler is None:
+            handler = cls._register_normalizer(type(tool))
+        return handler(cls, tool)
+
+    @classmethod
+    def normalize_all(cls, tools) -> list["ToolContext"]:
+        """
+        Normalize an iterable of mixed tool types into one flat list of ToolContext instances.
+
+        Toolsets are expanded onto an explicit work list instead of recursing per nested
+        tool, and every result lands directly in a single output list.
 
-        if isinstance(tool, cls):
-            result.append(tool)
-        elif isinstance(tool, Tool):
-            result.append(cls.from_pydantic_tool(tool))
-        elif isinstance(tool, FunctionToolset):
-            for pydantic_tool in tool.tools.values():
-                result.append(cls.from_pydantic_tool(pydantic_tool))
-        elif isinstance(tool, Callable):
-            result.append(cls(tool=tool))
+        Args:
+            tools: Iterable of tools of any type accepted by `normalize`
 
+        Returns:
+            List of ToolContext instances (may be empty)
+        """
+        result: list[ToolContext] = []
+        extend = result.extend  # local bindings keep the loop on fast-local lookups
+        dispatch = cls._normalize_dispatch
+        toolset_handler = ToolContext._normalize_toolset
+        stack = deque(tools)
+        while stack:
+            tool = stack.popleft()
+            handler = dispatch.get(type(tool))
+            if handler is None:
+                handler = cls._register_normalizer(type(tool))
+            if handler is toolset_handler:
+                # Expand in place at the front so toolset children keep their
+                # position relative to the tools that follow the toolset
+                stack.extendleft(reversed(tool.tools.values()))
+            else:
+                extend(handler(cls, tool))
         return result
 
+    # Concrete tool type -> handler, filled lazily the first time a type is seen
+    # so repeated normalization is a dict lookup instead of an isinstance chain.
+    # perf: normalization is dispatch and attribute access on heterogeneous
+    # objects — keep it pure Python; JIT/native compilation buys nothing here
+    _normalize_dispatch: ClassVar[dict[type, Callable]] = {}
+
+    @classmethod
+    def _register_normalizer(cls, tool_type: type) -> Callable:
+        """Resolve the normalize handler for a new tool type once and cache it."""
+        if issubclass(tool_type, ToolContext):
+            handler = ToolContext._normalize_context
+        elif issubclass(tool_type, Tool):
+            handler = ToolContext._normalize_tool
+        elif issubclass(tool_type, FunctionToolset):
+            handler = ToolContext._normalize_toolset
+        elif issubclass(tool_type, Callable):
+            handler = ToolContext._normalize_callable
+        else:
+            handler = ToolContext._normalize_invalid
+        cls._normalize_dispatch[tool_type] = handler
+        return handler
+
+    @staticmethod
+    def _normalize_context(cls, tool) -> list["ToolContext"]:
+        return [tool]
+
+    @staticmethod
+    def _normalize_tool(cls, tool) -> list["ToolContext"]:
+        return [cls.from_pydantic_tool(tool)]
+
+    @staticmethod
+    def _normalize_toolset(cls, tool) -> list["ToolContext"]:
+        return [cls.from_pydantic_tool(pydantic_tool) for pydantic_tool in tool.tools.values()]
+
+    @staticmethod
+    def _normalize_callable(cls, tool) -> list["ToolContext"]:
+        return [cls(tool=tool)]
+
+    @staticmethod
+    def _normalize_invalid(cls, tool) -> list["ToolContext"]:
+        return []
+
     def args_render(self) -> str:
         """Render the tool arguments as a string."""
         args_list = []
+        # Bound locals keep the per-parameter loop on fast-local lookups
+        append = args_list.append
+        empty = inspect.Parameter.empty
         for name, param in self.tool_args.items():
             arg = f"{name}"
-            if param.annotation is not inspect.Parameter.empty:
+            if param.annotation is not empty:
                 arg += f": {param.annotation.__name__}"
-            if param.default is not inspect.Parameter.empty:
+            if param.default is not empty:
                 arg += f"{' = ' + str(param.default)}"
-            args_list.append(arg)
+            append(arg)
         return ", ".join(args_list) if args_list else "Doesn't accept arguments"
 
     def render(self) -> str:
@@ -14,14 +14,21 @@ class PromptSection(ABC):
 
     Properties:
         context (Context): context information only accessible at runtime
+        tools_desc (str): comma-separated tool names, cached until tools change
+        tools_info (str): one `- name: description` line per tool, cached until tools change
+        tools_list (str): one `• name (for description)` bullet per tool, cached until tools change
 
     Methods:
         add_providers: extend the providers included
         add_tools: extend the tools included
+        providers_of_type: get providers previously added, grouped by their concrete class
         formatter: abstract method to be defined in concrete class
         render: abstract method to be defined in concrete class to generate string; also aliased using `str()`
+        cached_render: render once and reuse the output while context, providers, and tools are unchanged
     """
 
+    __slots__ = ("_by_type", "_context", "_render_cache", "_render_key", "_tools_cache", "providers", "tools")
+
     def __init__(
         self,
         context: Context | None = None,
@@ -31,9 +38,13 @@ class PromptSection(ABC):
         """Initialize the PromptSection with context, tools, and providers."""
         self._context = context
         self.providers = list(providers or [])
-        self.tools: list[ToolContext] = []
-        for t in tools or []:
-            self.tools.extend(ToolContext.normalize(t))
+        self._by_type: dict[type, list] = {}
+        for p in self.providers:
+            self._by_type.setdefault(type(p), []).append(p)
+        self.tools: list[ToolContext] = ToolContext.normalize_all(tools or ())
+        self._tools_cache: dict[str, str] = {}
+        self._render_cache: str | None = None
+        self._render_key: tuple | None = None
 
     @property
     def context(self) -> Context:
@@ -45,27 +56,89 @@ class PromptSection(ABC):
     @context.setter
     def context(self, value: Context) -> None:
         """Set the context."""
-        if not isinstance(value, Context) or issubclass(value.__class__, Context) is False:
+        if not isinstance(value, Context):
             raise TypeError(f"Context must be an instance of Context or its subclass for {self.__class__.__name__}.")
         self._context = value
 
     def add_providers(self, *providers: BaseProvider) -> None:
         """Add variable quantity of providers."""
-        self.providers.extend([p for p in providers if isinstance(p, BaseProvider)])
+        for p in providers:
+            if isinstance(p, BaseProvider):
+                self.providers.append(p)
+                self._by_type.setdefault(type(p), []).append(p)
+        self._render_key = None
+
+    def providers_of_type(self, provider_type: type) -> list:
+        """Get providers of exactly `provider_type`, without scanning or isinstance checks.
+
+        The buckets are keyed by concrete class and kept current by `__init__` and `add_providers`;
+        providers appended to `providers` directly are not seen.
+        """
+        return self._by_type.get(provider_type, [])
 
     def add_tools(self, *tools) -> None:
         """Add variable quantity of tools (ToolContext, pydantic-ai Tool, or FunctionToolset)."""
-        for t in tools:
-            self.tools.extend(ToolContext.normalize(t))
+        self.tools.extend(ToolContext.normalize_all(tools))
+        self._tools_cache.clear()
+        self._render_key = None
+
+    @property
+    def tools_desc(self) -> str:
+        """Get the tool names as a comma-separated string; formatted once until tools change."""
+        desc = self._tools_cache.get("desc")
+        if desc is None:
+            desc = self._tools_cache["desc"] = ", ".join(t.tool_name for t in self.tools)
+        return desc
+
+    @property
+    def tools_info(self) -> str:
+        """Get one `- name: description` line per tool; formatted once until tools change."""
+        info = self._tools_cache.get("info")
+        if info is None:
+            info = self._tools_cache["info"] = "\n".join(t.summary_line for t in self.tools)
+        return info
+
+    @property
+    def tools_list(self) -> str:
+        """Get one `• name (for description)` bullet per tool; formatted once until tools change."""
+        listing = self._tools_cache.get("list")
+        if listing is None:
+            listing = self._tools_cache["list"] = "\n".join(
+                f"• {t.tool_name} (for {t.tool_description.lower()})" for t in self.tools
+            )
+        return listing
+
+    def _current_key(self) -> tuple:
+        """Cheap identity fingerprint of the inputs that feed `render`."""
+        return (
+            id(self._context),
+            tuple(id(p) for p in self.providers),
+            tuple(id(t) for t in self.tools),
+        )
+
+    def cached_render(self) -> str:
+        """Render the section, reusing the last output while context, providers, and tools are unchanged."""
+        key = self._current_key()
+        if key != self._render_key:
+            self._render_cache = self.render()
+            self._render_key = key
+        return self._render_cache
 
     @abstractmethod
     def formatter(self, *args, **kwargs) -> str:
         """Format the prompt text."""
         raise NotImplementedError
 
+    # perf: rendering is string-building, not numeric work — keep implementations
+    # pure Python; JIT/native compilation (Numba, Cython) regresses these paths
     @abstractmethod
     def render(self) -> str:
-        """Render the prompt section as a string."""
+        """Render the prompt section as a string.
+
+        Implementations that assemble output from several pieces should accumulate
+        them in a list and join once (`"".join(parts)` or a separator join) rather
+        than concatenating with `+=`, which copies the growing string each step.
+        """
         raise NotImplementedError
 
     def __str__(self) -> str:
@@ -78,16 +151,32 @@ class BasePrompt(ABC):
     Abstract base class for different types of prompts.
 
     Attributes:
+        SECTION_SEPARATOR (str): separator placed between rendered sections by `render_sections`
         sections (PromptSection): list of prompt sections that compose the final prompt
 
     Methods:
+        render_sections: join all section renders with `SECTION_SEPARATOR`
         render: abstract method to be defined in concrete class to generate string; also aliased using `str()`
     """
 
+    __slots__ = ("sections",)
+
+    # Override on subclasses that want a heavier rule between sections
+    SECTION_SEPARATOR = "\n\n"
+
     def __init__(self, *sections: PromptSection) -> None:
         """Initialize the BasePrompt with sections."""
         self.sections = list(sections or [])
 
+    def render_sections(self) -> str:
+        """Render every section joined by `SECTION_SEPARATOR`.
+
+        The common body for `render` implementations that need no scaffolding around
+        the sections; the list display lets join pre-size its output in one pass.
+        """
+        return self.SECTION_SEPARATOR.join([section.render() for section in self.sections])
+
+    # perf: keep pure Python here as well — see the note on PromptSection.render
     @abstractmethod
     def render(self) -> str:
         """Render the prompt as a string."""
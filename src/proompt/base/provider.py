@@ -3,6 +3,8 @@ from typing import Generic, TypeVar
 
 DataType = TypeVar("DataType")
 
+_MISSING = object()  # sentinel distinguishing "no cached result" from a cached None
+
 
 class BaseProvider(ABC, Generic[DataType]):
     """
@@ -15,8 +17,12 @@ class BaseProvider(ABC, Generic[DataType]):
     Methods:
         run: abstract method to be defined by concrete class, retrieves data from provider
         arun: optional asynchronous method to be defined by concrete class
+        cached_run: run the provider once and reuse the result until invalidated
+        invalidate: discard any cached result so the next cached_run executes again
     """
 
+    __slots__ = ("_cached_result",)
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -34,6 +40,17 @@ class BaseProvider(ABC, Generic[DataType]):
         """Synchronously run the provider and return the result."""
         raise NotImplementedError
 
+    def cached_run(self, *args, **kwargs) -> DataType:
+        """Run the provider, reusing the result from a previous call until `invalidate` is called."""
+        result = getattr(self, "_cached_result", _MISSING)
+        if result is _MISSING:
+            result = self._cached_result = self.run(*args, **kwargs)
+        return result
+
+    def invalidate(self) -> None:
+        """Discard the cached `run` result, if any."""
+        self._cached_result = _MISSING
+
     async def arun(self, *args, **kwargs) -> DataType:
         """Asynchronously run the provider and return the result."""
         raise NotImplementedError
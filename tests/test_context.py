@@ -149,6 +149,27 @@ class TestToolContext:
         tool_ctx = ToolContext(named_function)
         assert str(tool_ctx) == tool_ctx.render()
 
+    def test_normalize_all_preserves_order(self, named_function, function_no_doc):
+        """Test that toolset expansion keeps tools in the order they were given."""
+        from pydantic_ai import FunctionToolset, Tool
+
+        toolset = FunctionToolset(tools=[Tool(named_function, takes_ctx=False)])
+        normalized = ToolContext.normalize_all([toolset, function_no_doc])
+
+        assert [t.tool_name for t in normalized] == ["test_function", "no_doc_function"]
+        # Matches the per-item normalize results concatenated in input order
+        assert [t.tool_name for t in ToolContext.normalize(toolset) + ToolContext.normalize(function_no_doc)] == [
+            "test_function",
+            "no_doc_function",
+        ]
+
+    def test_summary_line_cached(self, named_function):
+        """Test that summary_line formats once and the same string is reused."""
+        tool_ctx = ToolContext(named_function)
+        line = tool_ctx.summary_line
+        assert line == "- test_function: Test function docstring."
+        assert tool_ctx.summary_line is line
+
     # TODO: more nicer
     def f():
         pass
@@ -151,6 +151,17 @@ class TestPromptSection:
 
         assert len(section.providers) == 1 and all(isinstance(p, BaseProvider) for p in section.providers)
 
+    def test_providers_of_type_buckets(self):
+        """Test that providers are grouped by concrete class at init and via add_providers."""
+        provider1 = ConcreteProvider("provider1")
+        provider2 = ConcreteProvider("provider2")
+        section = ConcretePromptSection(None, None, provider1)
+
+        section.add_providers(provider2, "not a provider")
+
+        assert section.providers_of_type(ConcreteProvider) == [provider1, provider2]
+        assert section.providers_of_type(str) == []
+
     def test_add_tools(self):
         """Test adding tools."""
         section = ConcretePromptSection()
@@ -171,6 +182,43 @@ class TestPromptSection:
 
         assert len(section.tools) == 1 and all(isinstance(t, ToolContext) for t in section.tools)
 
+    def test_tools_strings_cached(self):
+        """Test that formatted tool strings are cached and refreshed by add_tools."""
+
+        def first_tool():
+            """First tool."""
+
+        def second_tool():
+            """Second tool."""
+
+        section = ConcretePromptSection(None, [first_tool])
+        desc = section.tools_desc
+        assert desc == "first_tool" and section.tools_desc is desc
+        section.add_tools(second_tool)
+        assert section.tools_desc == "first_tool, second_tool"
+        assert section.tools_info == "- first_tool: First tool.\n- second_tool: Second tool."
+        assert section.tools_list == "\u2022 first_tool (for first tool.)\n\u2022 second_tool (for second tool.)"
+
+    def test_cached_render_reuses_output(self):
+        """Test that cached_render re-renders only when section inputs change."""
+
+        class CountingSection(ConcretePromptSection):
+            calls = 0
+
+            def render(self) -> str:
+                CountingSection.calls += 1
+                return f"render {self.calls}"
+
+        section = CountingSection()
+        assert section.cached_render() == "render 1" == section.cached_render()
+        assert CountingSection.calls == 1
+
+        section.add_providers(ConcreteProvider())
+        assert section.cached_render() == "render 2"
+        section.context = ConcreteContext()
+        assert section.cached_render() == "render 3" == section.cached_render()
+        assert CountingSection.calls == 3
+
     def test_str_delegates_to_render(self, prompt_section: ConcretePromptSection):
         """Test that __str__ delegates to render."""
         assert str(prompt_section) == prompt_section.render()
@@ -211,6 +259,13 @@ class TestBasePrompt:
         """Test that __str__ delegates to render."""
         assert (prompt := ConcretePrompt()) and str(prompt) == prompt.render()
 
+    def test_render_sections_joins_with_separator(self, prompt_sections: list[ConcretePromptSection]):
+        """Test that render_sections joins section renders with SECTION_SEPARATOR."""
+        prompt = ConcretePrompt(*prompt_sections)
+
+        assert prompt.render_sections() == "rendered section\n\nrendered section"
+        assert ConcretePrompt().render_sections() == ""
+
     def test_abstract_method_enforced(self):
         """Test that render method is abstract."""
         with pytest.raises(TypeError):
@@ -101,6 +101,27 @@ class TestBaseProvider:
             str(dict_provider) == PROVIDER_STR.format(dict_provider.name, dict_provider.provider_ctx)
         ) and f"{dict_provider}" == PROVIDER_STR.format(dict_provider.name, dict_provider.provider_ctx)
 
+    def test_cached_run_reuses_result(self, provider: ConcreteProvider):
+        """Test that cached_run only executes run once until invalidated."""
+        calls = []
+
+        def counting_run(*args, **kwargs):
+            calls.append(1)
+            return "test_result"
+
+        provider.run = counting_run
+        assert provider.cached_run() == "test_result" == provider.cached_run()
+        assert len(calls) == 1
+
+    def test_invalidate_clears_cached_result(self, provider: ConcreteProvider):
+        """Test that invalidate forces the next cached_run to execute run again."""
+        results = iter(["first", "second"])
+        provider.run = lambda *args, **kwargs: next(results)
+
+        assert provider.cached_run() == "first" == provider.cached_run()
+        provider.invalidate()
+        assert provider.cached_run() == "second"
+
     def test_is_abstract_base_class(self):
         """Test that BaseProvider is properly abstract."""
         assert BaseProvider.__class__ == ABCMeta